@@ -5,14 +5,14 @@ from .ecs.entity import EntityId
 
 from .core.app import App
 from .render.camera import Camera
-from .render.renderer import RenderSystem
+from .render.renderer import RenderSystem, Screen, Sprite
 from .platformer.character import Character
 from .platformer.components import Controller as PfController, Params as PfParams, JumpState as PfJumpState, PlayerTag as PfPlayerTag
 from .platformer.systems import InputSystem as PfInputSystem, MovementSystem as PfMovementSystem, TileCollisionSystem as PfTileCollisionSystem
 
 __all__ = [
     'World', 'System', 'Component', 'EntityId',
-    'App', 'Camera', 'RenderSystem',
+    'App', 'Camera', 'RenderSystem', 'Screen', 'Sprite',
     'Character', 'PfController', 'PfParams', 'PfJumpState', 'PfPlayerTag',
     'PfInputSystem', 'PfMovementSystem', 'PfTileCollisionSystem'
 ]
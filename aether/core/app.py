@@ -1,29 +1,159 @@
+import os
+import time
+
 import pygame
 
+from .timestep import FixedTimestep
+
 
 class App:
-    """Minimal application shell. Integrate with your game loop."""
+    """Minimal application shell. Integrate with your game loop.
 
-    def __init__(self, size=(1200, 800), caption='Aether App', fps=60):
-        pygame.init()
-        self.screen = pygame.display.set_mode(size)
-        pygame.display.set_caption(caption)
-        self.clock = pygame.time.Clock()
+    headless=True skips the window, rendering and frame pacing so a World can
+    be stepped as fast as the CPU allows (servers, CI, replay validation).
+    Pygame is then not initialised at all unless dummy_video=True, which
+    brings it up on SDL's dummy video driver for code that needs a display
+    (Input, Surface.convert_alpha).
+
+    dirty_rects=True suits mostly static scenes (menus, inventory, pause):
+    the screen is no longer cleared every frame; renderers erase with
+    clear(rect) and report what they drew with mark_dirty(rect), and
+    end_frame presents only those regions. Content redrawn every frame is
+    reported with mark_drawn(rects) instead: begin_frame erases those
+    regions before anything is drawn the next frame. The built-in renderers
+    (ChunkedTileRenderer, RenderSystem, ParticlePool) do this when given
+    the app. When they cover more than
+    `full_flip_ratio` of the screen, or after invalidate(), the whole
+    screen is flipped instead; `full_redraw` tells renderers when that
+    frame starts from a cleared screen and everything must be drawn.
+    """
+
+    def __init__(self, size=(1200, 800), caption='Aether App', fps=60,
+                 headless=False, dummy_video=False, dirty_rects=False,
+                 background=(20, 20, 30), full_flip_ratio: float = 0.5):
+        self.headless = headless
         self.fps = fps
         self.running = True
+        self.background = background
+        self.dirty_rects = dirty_rects
+        self.full_flip_ratio = full_flip_ratio
+        self.full_redraw = True
+        self.presents = {'flip': 0, 'update': 0, 'skip': 0}
+        self._dirty = []
+        self._drawn = []  # erased at the start of the next frame
+        if dummy_video:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        if headless and not dummy_video:
+            self.screen = None
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode(size)
+            pygame.display.set_caption(caption)
+        self.clock = pygame.time.Clock()
 
     def poll(self):
+        if self.screen is None:
+            return
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
 
     def begin_frame(self):
-        self.screen.fill((20, 20, 30))
+        if self.headless:
+            return
+        drawn, self._drawn = self._drawn, []
+        if not self.dirty_rects or self.full_redraw:
+            self.screen.fill(self.background)
+            return
+        for rect in drawn:
+            self.screen.fill(self.background, rect)
+        self._dirty.extend(drawn)
 
     def end_frame(self):
-        pygame.display.flip()
+        if self.headless:
+            return
+        self._present()
         self.clock.tick(self.fps)
 
+    def mark_dirty(self, rect):
+        """Report a screen region changed this frame (dirty-rect mode)."""
+        self._dirty.append(pygame.Rect(rect))
+
+    def mark_drawn(self, rects):
+        """Report regions drawn this frame that are erased again before the next one."""
+        rects = [pygame.Rect(r) for r in rects]
+        self._drawn.extend(rects)
+        self._dirty.extend(rects)
+
+    def clear(self, rect):
+        """Fill a region with the background and mark it dirty, e.g. where a sprite was."""
+        rect = pygame.Rect(rect)
+        if self.screen is not None:
+            self.screen.fill(self.background, rect)
+        self._dirty.append(rect)
+
+    def invalidate(self):
+        """Clear and present the whole screen next frame (resize, scene change, unpause)."""
+        self.full_redraw = True
+
+    def _present(self):
+        dirty, self._dirty = self._dirty, []
+        if not self.dirty_rects or self.full_redraw:
+            self.full_redraw = False
+            pygame.display.flip()
+            self.presents['flip'] += 1
+            return
+        bounds = self.screen.get_rect()
+        dirty = [r.clip(bounds) for r in dirty]
+        dirty = [r for r in dirty if r.w and r.h]
+        if not dirty:
+            self.presents['skip'] += 1
+            return
+        # Overlaps are counted twice, which only makes the fallback kick in sooner
+        if sum(r.w * r.h for r in dirty) > self.full_flip_ratio * bounds.w * bounds.h:
+            pygame.display.flip()
+            self.presents['flip'] += 1
+        else:
+            pygame.display.update(dirty)
+            self.presents['update'] += 1
+
+    def run(self, update, render=None, step: float | None = None, max_steps: int = 5):
+        """Fixed-timestep loop until `running` is cleared.
+
+        Each frame calls update(step) zero or more times to catch up with real
+        time (capped at max_steps), then render(alpha) once, where alpha in
+        [0, 1) is how far the clock is between the last two simulation steps.
+        Headless apps skip the clock and rendering and step back to back.
+        """
+        self.timestep = FixedTimestep(step or 1.0 / self.fps, max_steps)
+        if self.headless:
+            while self.running:
+                self.poll()
+                update(self.timestep.step)
+            return
+        last = time.perf_counter()
+        while self.running:
+            now = time.perf_counter()
+            frame_time, last = now - last, now
+            self.poll()
+            for _ in range(self.timestep.advance(frame_time)):
+                update(self.timestep.step)
+            self.begin_frame()
+            if render is not None:
+                render(self.timestep.alpha)
+            self.end_frame()
+
+    def simulate(self, update, steps: int, step: float | None = None) -> float:
+        """Call update(step) `steps` times without pacing; returns elapsed wall seconds."""
+        dt = step or 1.0 / self.fps
+        start = time.perf_counter()
+        for _ in range(steps):
+            if not self.running:
+                break
+            update(dt)
+        return time.perf_counter() - start
+
     def quit(self):
         pygame.quit()
 
@@ -0,0 +1,30 @@
+class FixedTimestep:
+    """Accumulates frame time and hands out whole simulation steps of a fixed size.
+
+    When the game falls behind, at most `max_steps` steps run per frame and
+    the surplus is dropped (counted in `dropped`) instead of piling up.
+    """
+
+    def __init__(self, step: float = 1.0 / 60.0, max_steps: int = 5):
+        self.step = float(step)
+        self.max_steps = int(max_steps)
+        self.accumulator = 0.0
+        self.dropped = 0.0
+
+    def advance(self, frame_time: float) -> int:
+        """Add elapsed real time; returns how many steps to simulate now."""
+        self.accumulator += max(0.0, frame_time)
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            surplus = self.accumulator - steps * self.step
+            self.accumulator = surplus % self.step
+            self.dropped += surplus - self.accumulator
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator, for render interpolation."""
+        return self.accumulator / self.step
@@ -0,0 +1,179 @@
+import sys
+
+import numpy as np
+
+
+def _column_property(name: str):
+    def fget(self):
+        return self._store.columns[name][self._row].item()
+
+    def fset(self, value):
+        self._store.columns[name][self._row] = value
+
+    return property(fget, fset)
+
+
+def _view_class(comp_cls, fields):
+    ns = {'__slots__': ('_store', '_row'), 'component_type': comp_cls}
+    for name in fields:
+        ns[name] = _column_property(name)
+    return type(f'{comp_cls.__name__}View', (comp_cls,), ns)
+
+
+_COLUMN_TYPES = (float, int, bool)
+
+
+def component_columns(comp_cls) -> dict:
+    """{field: type} for an @component class, from its _fields and annotations."""
+    types = {}
+    for base in reversed(comp_cls.__mro__):
+        types.update(base.__dict__.get('__annotations__', {}))
+    columns = {}
+    for name in getattr(comp_cls, '_fields', ()):
+        if types.get(name) not in _COLUMN_TYPES:
+            raise TypeError(f'{comp_cls.__name__}.{name} is not a float, int or bool field')
+        columns[name] = types[name]
+    return columns
+
+
+class ColumnStore:
+    """Keeps one component type's fields in contiguous NumPy arrays.
+
+    The world stores a lightweight view per entity instead of the original
+    object; views subclass the component type and read/write their row, so
+    `world.get(e, Transform).x += 1` keeps working. Rows stay packed: removing
+    an entity moves the last row into the hole. `fields` defaults to every
+    field of an @component class (see component_columns).
+    """
+
+    def __init__(self, comp_cls, fields: dict | None = None, capacity: int = 1024):
+        self.comp_cls = comp_cls
+        self.fields = dict(component_columns(comp_cls) if fields is None else fields)  # {name: dtype}
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.columns = {name: np.zeros(self.capacity, dtype=dt) for name, dt in self.fields.items()}
+        self.rows = {}      # {entity: row}
+        self.entities = []  # row -> entity
+        self.views = []     # row -> view
+        self.view_cls = _view_class(comp_cls, self.fields)
+
+    def attach(self, entity, component):
+        row = self.rows.get(entity)
+        if row is None:
+            if self.count == self.capacity:
+                self._grow()
+            row = self.count
+            self.count += 1
+            self.rows[entity] = row
+            self.entities.append(entity)
+            view = self.view_cls.__new__(self.view_cls)
+            view._store = self
+            view._row = row
+            self.views.append(view)
+        view = self.views[row]
+        if component is not view:
+            for name in self.fields:
+                self.columns[name][row] = getattr(component, name)
+        return view
+
+    def detach(self, entity):
+        """Free an entity's row; returns a plain component holding its last values."""
+        row = self.rows.pop(entity)
+        comp = self.comp_cls.__new__(self.comp_cls)
+        for name, col in self.columns.items():
+            setattr(comp, name, col[row].item())
+        self.views[row]._store = None  # stale views fail loudly instead of aliasing another row
+        last = self.count - 1
+        if row != last:
+            for col in self.columns.values():
+                col[row] = col[last]
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved] = row
+            self.views[row] = self.views[last]
+            self.views[row]._row = row
+        self.entities.pop()
+        self.views.pop()
+        self.count = last
+        return comp
+
+    def snapshot(self):
+        """(entities, {field: array copy}) of the packed rows; see restore()."""
+        n = self.count
+        return tuple(self.entities), {name: col[:n].copy() for name, col in self.columns.items()}
+
+    def restore(self, state):
+        """Load rows saved by snapshot() (None empties the store). Views of
+        entities present in both keep working; others go stale as in detach."""
+        entities, columns = state if state is not None else ((), {})
+        n = len(entities)
+        while self.capacity < n:
+            self._grow()
+        for name, values in columns.items():
+            self.columns[name][:n] = values
+        old = {e: self.views[row] for e, row in self.rows.items()}
+        self.rows = {e: row for row, e in enumerate(entities)}
+        self.entities = list(entities)
+        self.views = []
+        for row, e in enumerate(entities):
+            view = old.pop(e, None)
+            if view is None:
+                view = self.view_cls.__new__(self.view_cls)
+                view._store = self
+            view._row = row
+            self.views.append(view)
+        for view in old.values():
+            view._store = None
+        self.count = n
+
+    def nbytes(self) -> int:
+        """Approximate bytes held: column buffers plus the per-entity views."""
+        views = sys.getsizeof(self.views[0]) * self.count if self.views else 0
+        return sum(col.nbytes for col in self.columns.values()) + views
+
+    def column(self, name: str):
+        """Live slice of the packed rows for one field."""
+        return self.columns[name][:self.count]
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, col in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=col.dtype)
+            grown[:col.shape[0]] = col
+            self.columns[name] = grown
+
+
+class ColumnQuery:
+    """Row indices into each column store for the entities of a world query.
+
+    Rebuilt only when the world's structure changes. When every store holds
+    exactly the queried entities in the same order, a plain slice is returned
+    so reads and writes avoid fancy-index copies.
+    """
+
+    def __init__(self, world, *comp_classes, exclude=()):
+        self.world = world
+        self.comp_classes = comp_classes
+        self.exclude = tuple(exclude)
+        self._version = None
+        self._rows = ()
+
+    def rows(self):
+        if self._version != self.world.version:
+            self._rows = self._build()
+            self._version = self.world.version
+        return self._rows
+
+    def _build(self):
+        stores = [self.world.storages[c] for c in self.comp_classes]
+        entities = [r[0] for r in self.world.query(*self.comp_classes, exclude=self.exclude)]
+        n = len(entities)
+        identity = np.arange(n, dtype=np.intp)
+        rows = []
+        for store in stores:
+            idx = np.fromiter((store.rows[e] for e in entities), dtype=np.intp, count=n)
+            if store.count == n and np.array_equal(idx, identity):
+                rows.append(slice(0, n))
+            else:
+                rows.append(idx)
+        return tuple(rows)
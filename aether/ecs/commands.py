@@ -0,0 +1,66 @@
+from .entity import EntityId
+
+_ADD, _REMOVE, _DESTROY = range(3)
+
+
+class CommandBuffer:
+    """Records structural changes (create/add/remove/destroy) for a later batched flush.
+
+    Systems record into `world.commands` while iterating queries; the world
+    applies the buffer between systems or at the end of the frame, so query
+    results never change underneath a running loop.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self._ops = []
+
+    def __len__(self):
+        return len(self._ops)
+
+    def create(self, *components) -> EntityId:
+        # The id is reserved immediately so callers can reference it; its
+        # components only become visible to queries after the flush.
+        entity = self.world.create()
+        for comp in components:
+            self._ops.append((_ADD, entity, comp))
+        return entity
+
+    def add(self, entity: EntityId, component):
+        self._ops.append((_ADD, entity, component))
+
+    def remove(self, entity: EntityId, comp_cls):
+        self._ops.append((_REMOVE, entity, comp_cls))
+
+    def destroy(self, entity: EntityId):
+        self._ops.append((_DESTROY, entity, None))
+
+    def extend(self, other: 'CommandBuffer'):
+        """Move another buffer's pending commands onto the end of this one."""
+        self._ops.extend(other._ops)
+        other._ops = []
+
+    def clear(self):
+        """Drop pending commands without applying them."""
+        self._ops = []
+
+    def flush(self):
+        """Apply recorded commands in order; consecutive adds to one entity move it once."""
+        ops, self._ops = self._ops, []
+        world = self.world
+        i, n = 0, len(ops)
+        while i < n:
+            op, entity, arg = ops[i]
+            i += 1
+            if not world.is_alive(entity):
+                continue  # destroyed earlier in this batch (or by someone else)
+            if op == _ADD:
+                comps = [arg]
+                while i < n and ops[i][0] == _ADD and ops[i][1] == entity:
+                    comps.append(ops[i][2])
+                    i += 1
+                world.add_many(entity, comps)
+            elif op == _REMOVE:
+                world.remove(entity, arg)
+            else:
+                world.destroy(entity)
@@ -1,5 +1,96 @@
 class Component:
     """Base class for components (data-only objects)."""
-    pass
+    __slots__ = ()
 
 
+_COERCE = (float, int, bool)
+
+
+def component(cls):
+    """Class decorator: annotated fields become a slotted Component with a generated __init__.
+
+        @component
+        class Transform(Component):
+            x: float = 0.0
+            y: float = 0.0
+
+    Instances carry no __dict__. Fields annotated float/int/bool are coerced
+    on construction, like the hand-written components did. `_fields` lists
+    every field, inherited ones first; fields from the first required one
+    that follows a defaulted one onwards are keyword-only. An __init__
+    written in the class body replaces the generated one, and methods may
+    use zero-argument super().
+    """
+    own = tuple(cls.__dict__.get('__annotations__', {}))
+    inherited = tuple(dict.fromkeys(f for base in reversed(cls.__mro__[1:]) for f in getattr(base, '_fields', ())))
+    fields = inherited + tuple(f for f in own if f not in inherited)
+    types = {}
+    defaults = {}
+    for base in reversed(cls.__mro__[1:]):
+        types.update(base.__dict__.get('__annotations__', {}))
+        defaults.update(getattr(base, '_defaults', {}))
+    types.update(cls.__dict__.get('__annotations__', {}))
+    defaults.update({f: cls.__dict__[f] for f in own if f in cls.__dict__})
+
+    ns = {k: v for k, v in cls.__dict__.items() if k not in own and k not in ('__dict__', '__weakref__')}
+    ns['__slots__'] = tuple(f for f in own if f not in inherited)
+    ns['_fields'] = fields
+    ns['_defaults'] = defaults
+
+    env = {}
+    params, body = [], []
+    for name in fields:
+        if name in defaults:
+            env[f'_d_{name}'] = defaults[name]
+            params.append(f'{name}=_d_{name}')
+        else:
+            params.append(name)
+        if types.get(name) in _COERCE:
+            env[f'_c_{name}'] = types[name]
+            body.append(f'    self.{name} = _c_{name}({name})')
+        else:
+            body.append(f'    self.{name} = {name}')
+    # A required field after a defaulted one (e.g. added by a subclass) can't
+    # be positional without reordering; it and every later field become
+    # keyword-only, so positional arguments always follow _fields
+    gap = next((i for i in range(1, len(params)) if '=' in params[i - 1] and '=' not in params[i]), None)
+    if gap is not None:
+        params.insert(gap, '*')
+    if '__init__' not in ns:  # a hand-written __init__ is kept as is
+        src = f"def __init__(self, {', '.join(params)}):\n" + ('\n'.join(body) or '    pass') + '\n'
+        exec(src, env)
+        ns['__init__'] = env['__init__']
+        ns['__init__'].__qualname__ = f'{cls.__qualname__}.__init__'
+    if '__repr__' not in ns:
+        ns['__repr__'] = _repr
+
+    bases = cls.__bases__
+    if not issubclass(cls, Component):
+        bases = (Component,) + tuple(b for b in bases if b is not object)
+    new_cls = type(cls)(cls.__name__, bases, ns)
+    _rebind_class_cells(ns, cls, new_cls)
+    return new_cls
+
+
+def _rebind_class_cells(ns, old, new):
+    """Point the __class__ cells behind zero-argument super() at the rebuilt class
+    (as dataclasses does for slots=True)."""
+    for value in ns.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            funcs = (value.__func__,)
+        elif isinstance(value, property):
+            funcs = (value.fget, value.fset, value.fdel)
+        else:
+            funcs = (value,)
+        for func in funcs:
+            code = getattr(func, '__code__', None)
+            if code is None or '__class__' not in code.co_freevars:
+                continue
+            cell = func.__closure__[code.co_freevars.index('__class__')]
+            if cell.cell_contents is old:
+                cell.cell_contents = new
+
+
+def _repr(self):
+    values = ', '.join(f'{f}={getattr(self, f)!r}' for f in self._fields)
+    return f'{type(self).__name__}({values})'
@@ -1,5 +1,21 @@
 class EntityId(int):
-    """Lightweight entity identifier."""
-    pass
+    """Lightweight entity identifier: slot index in the low bits, generation above."""
+    __slots__ = ()
 
+    INDEX_BITS = 32
+    INDEX_MASK = (1 << INDEX_BITS) - 1
 
+    @classmethod
+    def make(cls, index: int, generation: int = 0) -> 'EntityId':
+        return cls(index | (generation << cls.INDEX_BITS))
+
+    @property
+    def index(self) -> int:
+        return self & self.INDEX_MASK
+
+    @property
+    def generation(self) -> int:
+        return self >> self.INDEX_BITS
+
+    def __repr__(self):
+        return f'EntityId({self.index}v{self.generation})'
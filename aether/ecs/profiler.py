@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+from collections import deque
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+    """Per-system wall time per frame, rolling percentiles and Chrome trace export.
+
+    Enabled through World.enable_profiling(); when the world has no profiler
+    the update loop pays a single None check per system. Systems can also
+    report per-frame counts (entities processed, substeps taken) with count().
+    """
+
+    def __init__(self, budget_ms: float = 1000.0 / 60.0, window: int = 600, trace_frames: int = 300):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.frame = 0
+        self.samples = {}                           # {name: deque of ms}, one per frame
+        self.counters = {}                          # {name: deque of per-frame totals}
+        self.frame_ms = deque(maxlen=window)
+        self.over_budget = deque(maxlen=window)     # (frame index, ms)
+        self._trace = deque(maxlen=trace_frames)    # per-frame lists of trace events
+        self._events = []
+        self._current = {}                          # {name: ms} for the running frame
+        self._counts = {}                           # {name: total} for the running frame
+        self._frame_start = 0
+        self._origin = time.perf_counter_ns()
+        self._tids = {}
+        self._lock = threading.Lock()
+
+    def begin_frame(self):
+        self._events = []
+        self._current = {}
+        self._counts = {}
+        self._frame_start = time.perf_counter_ns()
+
+    def record(self, name: str, start_ns: int, end_ns: int):
+        ms = (end_ns - start_ns) / 1e6
+        with self._lock:
+            self._current[name] = self._current.get(name, 0.0) + ms
+            self._events.append(self._event(name, 'system', start_ns, end_ns))
+
+    def count(self, name: str, value: int = 1):
+        """Add to a per-frame counter; summarised under stats()['counters']."""
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def end_frame(self):
+        end = time.perf_counter_ns()
+        ms = (end - self._frame_start) / 1e6
+        self.frame_ms.append(ms)
+        for name, value in self._current.items():
+            series = self.samples.get(name)
+            if series is None:
+                series = self.samples[name] = deque(maxlen=self.window)
+            series.append(value)
+        for name, value in self._counts.items():
+            series = self.counters.get(name)
+            if series is None:
+                series = self.counters[name] = deque(maxlen=self.window)
+            series.append(value)
+            counter_event = self._event(name, 'counter', end, end)
+            counter_event.update(ph='C', args={'value': value})
+            del counter_event['dur']
+            self._events.append(counter_event)
+        frame_event = self._event('frame', 'frame', self._frame_start, end)
+        frame_event['args'] = {'frame': self.frame}
+        if ms > self.budget_ms:
+            self.over_budget.append((self.frame, ms))
+            frame_event['args']['over_budget'] = True
+        self._events.append(frame_event)
+        self._trace.append(self._events)
+        self.frame += 1
+
+    def stats(self) -> dict:
+        """{name: {count, mean, p50, p95, p99, max, last}} in milliseconds; 'frame' is the
+        whole update and 'counters' holds the same summary of each count() series."""
+        out = {name: self._summary(series) for name, series in self.samples.items()}
+        out['frame'] = self._summary(self.frame_ms)
+        out['frame']['over_budget'] = len(self.over_budget)
+        out['counters'] = {name: self._summary(series) for name, series in self.counters.items()}
+        return out
+
+    def chrome_trace(self) -> dict:
+        events = [e for frame in self._trace for e in frame]
+        for name, tid in self._tids.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': 0, 'tid': tid, 'args': {'name': name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump_chrome_trace(self, path: str):
+        """Write the buffered frames as JSON loadable in chrome://tracing or Perfetto."""
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def _event(self, name, cat, start_ns, end_ns):
+        return {
+            'name': name, 'cat': cat, 'ph': 'X', 'pid': 0, 'tid': self._tid(),
+            'ts': (start_ns - self._origin) / 1e3, 'dur': (end_ns - start_ns) / 1e3,
+        }
+
+    def _tid(self) -> int:
+        name = threading.current_thread().name
+        tid = self._tids.get(name)
+        if tid is None:
+            tid = self._tids[name] = len(self._tids)
+        return tid
+
+    @staticmethod
+    def _summary(series) -> dict:
+        values = sorted(series)
+        if not values:
+            return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0, 'last': 0.0}
+        return {
+            'count': len(values),
+            'mean': sum(values) / len(values),
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99),
+            'max': values[-1],
+            'last': series[-1],
+        }
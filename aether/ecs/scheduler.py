@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from .commands import CommandBuffer
+
+
+def conflicts(a, b) -> bool:
+    """True if two systems may not run at the same time."""
+    if a.reads is None and a.writes is None or b.reads is None and b.writes is None:
+        return True
+    a_reads, a_writes = set(a.reads or ()), set(a.writes or ())
+    b_reads, b_writes = set(b.reads or ()), set(b.writes or ())
+    return bool(a_writes & (b_reads | b_writes) or b_writes & a_reads)
+
+
+class Scheduler:
+    """Runs world systems in stages of mutually non-conflicting systems.
+
+    Stages are contiguous runs of the priority-sorted system list: a system
+    joins the current stage unless it conflicts with a system already in
+    it. Each system records into its own command buffer, and buffers are
+    applied in priority order, so the outcome matches sequential updates.
+    """
+
+    def __init__(self, world, max_workers: int | None = None):
+        self.world = world
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='aether-system')
+        self._systems = ()
+        self._stages = []
+        self._buffers = {}
+
+    def stages(self):
+        systems = tuple(self.world.systems)
+        if systems != self._systems:
+            self._systems = systems
+            self._stages = self._build_stages(systems)
+            self._buffers = {s: self._buffers.get(s) or CommandBuffer(self.world) for s in systems}
+        return self._stages
+
+    @staticmethod
+    def _build_stages(systems):
+        stages = []
+        for system in systems:
+            if stages and not any(conflicts(other, system) for other in stages[-1]):
+                stages[-1].append(system)
+            else:
+                stages.append([system])
+        return stages
+
+    def run(self, dt: float):
+        world = self.world
+        for stage in self.stages():
+            if len(stage) == 1:
+                self._run_one(stage[0], dt)
+            else:
+                futures = [self.executor.submit(self._run_one, s, dt) for s in stage]
+                for f in futures:
+                    f.result()
+            for system in stage:
+                buf = self._buffers[system]
+                if world.flush_between_systems:
+                    buf.flush()
+                else:
+                    world.commands.extend(buf)
+        world.commands.flush()
+
+    def _run_one(self, system, dt: float):
+        world = self.world
+        world._local.commands = self._buffers[system]
+        try:
+            world.run_system(system, dt)
+        finally:
+            world._local.commands = None
+
+    def shutdown(self):
+        self.executor.shutdown()
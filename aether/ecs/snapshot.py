@@ -0,0 +1,127 @@
+import copy
+from collections import deque
+from operator import attrgetter
+
+
+class Snapshot:
+    """Component and entity-allocator state of a World at one instant.
+
+    Field values of @component classes are captured as tuples and custom
+    storages (ColumnStore) copy their arrays, so a snapshot shares nothing
+    mutable with the world. World.frame is included so staggered Substeps
+    intervals replay identically. System state (broadphase pairs, caches) is not
+    part of it. Take one with World.snapshot(), apply with World.restore().
+    """
+
+    def __init__(self, world):
+        self.frame = world.frame
+        self.next_id = world._next_id
+        self.generations = world._generations.copy()
+        self.free = world._free.copy()
+        self.signatures = world._signatures.copy()
+        self.archetypes = {sig: tuple(arch.entities) for sig, arch in world._archetypes.items() if arch.entities}
+        self.stores = {}  # {ComponentClass: (entities, captured values)}
+        for cls, store in world.components.items():
+            storage = world.storages.get(cls)
+            if storage is not None:
+                self.stores[cls] = (tuple(store), storage.snapshot())
+            else:
+                self.stores[cls] = (tuple(store), _capture(cls, store.values()))
+
+    def apply(self, world):
+        world.frame = self.frame
+        world._next_id = self.next_id
+        world._generations = self.generations.copy()
+        world._free = self.free.copy()
+        world._signatures = self.signatures.copy()
+        world._commands.clear()
+
+        for cls in set(world.components) | set(self.stores):
+            entities, values = self.stores.get(cls, ((), None))
+            storage = world.storages.get(cls)
+            if storage is not None:
+                storage.restore(values)
+                views, rows = storage.views, storage.rows
+                world.components[cls] = {e: views[rows[e]] for e in entities}
+            else:
+                world.components[cls] = _restore(cls, world.components.get(cls, {}), entities, values)
+
+        for arch in world._archetypes.values():
+            arch.entities = {}
+        for sig, entities in self.archetypes.items():
+            world._archetype(sig).entities = dict.fromkeys(entities)
+        for q in world._queries.values():
+            q.rows = None
+        world.version += 1
+
+
+def _capture(cls, comps):
+    fields = getattr(cls, '_fields', None)
+    if fields is None:
+        return [copy.copy(c) for c in comps]  # hand-written component without _fields
+    if not fields:
+        return None
+    get = attrgetter(*fields)
+    if len(fields) == 1:
+        return [(v,) for v in map(get, comps)]
+    return list(map(get, comps))
+
+
+def _restore(cls, current, entities, values):
+    """Rebuild one store, writing into the existing instances so outside references stay live."""
+    fields = getattr(cls, '_fields', None)
+    out = {}
+    if fields is None:
+        for e, comp in zip(entities, values):
+            out[e] = copy.copy(comp)
+        return out
+    for i, e in enumerate(entities):
+        comp = current.get(e)
+        if comp is None:
+            comp = cls.__new__(cls)
+        if fields:
+            for name, value in zip(fields, values[i]):
+                setattr(comp, name, value)
+        out[e] = comp
+    return out
+
+
+class SnapshotHistory:
+    """Ring buffer of the last `capacity` frame snapshots; see World.record_history().
+
+    Frame n is the state after the n-th update since recording began.
+    Restoring a frame drops every newer one, so the world continues (and
+    records) from there, as a rollback would.
+    """
+
+    def __init__(self, world, capacity: int = 120):
+        self.world = world
+        self.frames = deque(maxlen=capacity)  # (frame, Snapshot), oldest first
+        self.frame = 0                        # index the next capture gets
+
+    def __len__(self):
+        return len(self.frames)
+
+    def capture(self) -> Snapshot:
+        snap = Snapshot(self.world)
+        self.frames.append((self.frame, snap))
+        self.frame += 1
+        return snap
+
+    def get(self, frame: int) -> Snapshot:
+        if self.frames:
+            first = self.frames[0][0]
+            if first <= frame < first + len(self.frames):
+                return self.frames[frame - first][1]
+        raise KeyError(f'frame {frame} is not in the history')
+
+    def restore(self, frame: int):
+        snap = self.get(frame)
+        snap.apply(self.world)
+        while self.frames[-1][0] > frame:
+            self.frames.pop()
+        self.frame = frame + 1
+
+    def rewind(self, frames: int = 1):
+        """Go back `frames` updates from the latest recorded frame."""
+        self.restore(self.frame - 1 - frames)
@@ -1,9 +1,20 @@
+class Entities:
+    """Marker for System.reads/writes: the system creates or destroys entities."""
+
+
 class System:
-    """Base class for systems. Override update(dt)."""
+    """Base class for systems. Override update(dt).
+
+    `reads`/`writes` optionally declare the component types the system
+    touches (include `Entities` when it creates or destroys entities, plus
+    the types it adds or removes). The Scheduler runs systems with
+    non-conflicting declarations concurrently; systems that leave both as
+    None run alone.
+    """
     priority = 0
+    reads = None
+    writes = None
     def __init__(self, world):
         self.world = world
     def update(self, dt: float):
         pass
-
-
@@ -1,4 +1,35 @@
+import sys
+import threading
+import time
+
+from .commands import CommandBuffer
 from .entity import EntityId
+from .profiler import FrameProfiler
+from .scheduler import Scheduler
+from .snapshot import Snapshot, SnapshotHistory
+
+
+class Archetype:
+    """Entities sharing one exact set of component types."""
+
+    def __init__(self, signature: frozenset):
+        self.signature = signature
+        self.entities = {}  # {entity: None}, insertion-ordered set
+        self.queries = []   # cached queries this archetype matches
+
+
+class _Query:
+    """Cached query: matching archetypes plus result rows until invalidated."""
+
+    def __init__(self, comp_classes, exclude=()):
+        self.comp_classes = comp_classes
+        self.required = frozenset(comp_classes)
+        self.excluded = frozenset(exclude)
+        self.archetypes = []
+        self.rows = None
+
+    def matches(self, signature: frozenset) -> bool:
+        return self.required <= signature and not self.excluded & signature
 
 
 class World:
@@ -6,36 +37,253 @@ class World:
 
     def __init__(self):
         self._next_id = 1
+        self._generations = [0]  # slot index -> current generation
+        self._free = []          # recycled slot indices
         self.components = {}  # {ComponentClass: {entity: component}}
         self.systems = []
+        self._signatures = {}  # {entity: frozenset of component classes}
+        self._archetypes = {}  # {signature: Archetype}
+        self._queries = {}     # {(component classes, excluded classes): _Query}
+        self.storages = {}     # {ComponentClass: custom storage, e.g. ColumnStore}
+        self._view_types = {}  # {storage view class: ComponentClass}
+        self.version = 0       # bumped on every structural change
+        self.frame = 0         # update() calls so far, counting the running one
+        self._commands = CommandBuffer(self)
+        self._local = threading.local()  # per-thread command buffer while scheduled
+        self.flush_between_systems = True  # False: apply commands once at end of frame
+        self.scheduler = None
+        self.profiler = None
+        self.history = None
+
+    @property
+    def commands(self) -> CommandBuffer:
+        """Command buffer for the running system (the world's own buffer outside the scheduler)."""
+        buf = getattr(self._local, 'commands', None)
+        return self._commands if buf is None else buf
 
     def create(self) -> EntityId:
-        eid = EntityId(self._next_id)
-        self._next_id += 1
-        return eid
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = self._next_id
+            self._next_id += 1
+            self._generations.append(0)
+        return EntityId.make(index, self._generations[index])
+
+    def is_alive(self, entity: EntityId) -> bool:
+        index = entity & EntityId.INDEX_MASK
+        return 0 < index < self._next_id and self._generations[index] == entity >> EntityId.INDEX_BITS
+
+    def destroy(self, entity: EntityId):
+        """Remove an entity and all its components; its slot is recycled with a new generation."""
+        if not self.is_alive(entity):
+            raise KeyError(f'{entity!r} is not alive')
+        sig = self._signatures.get(entity, frozenset())
+        for cls in sig:
+            del self.components[cls][entity]
+            storage = self.storages.get(cls)
+            if storage is not None:
+                storage.detach(entity)
+        self._move(entity, sig, frozenset())
+        self.version += 1
+        index = entity.index
+        self._generations[index] += 1
+        self._free.append(index)
+
+    def remove(self, entity: EntityId, comp_cls):
+        """Detach one component type from an entity; returns the removed component or None."""
+        store = self.components.get(comp_cls)
+        if store is None or entity not in store:
+            return None
+        comp = store.pop(entity)
+        storage = self.storages.get(comp_cls)
+        if storage is not None:
+            comp = storage.detach(entity)
+        sig = self._signatures[entity]
+        self._move(entity, sig, sig - {comp_cls})
+        self.version += 1
+        return comp
 
     def add(self, entity: EntityId, component):
-        self.components.setdefault(type(component), {})[entity] = component
+        self.add_many(entity, (component,))
+
+    def add_many(self, entity: EntityId, components):
+        """Add several components with a single archetype move."""
+        if not self.is_alive(entity):
+            raise KeyError(f'{entity!r} is not alive')
+        old_sig = self._signatures.get(entity, frozenset())
+        added = []
+        for component in components:
+            cls = type(component)
+            cls = self._view_types.get(cls, cls)
+            storage = self.storages.get(cls)
+            if storage is not None:
+                component = storage.attach(entity, component)
+            self.components.setdefault(cls, {})[entity] = component
+            if cls not in old_sig:
+                added.append(cls)
+        self.version += 1
+        if added:
+            self._move(entity, old_sig, old_sig.union(added))
+        elif old_sig:
+            # Same signature, but cached rows still reference the old instance
+            self._invalidate(self._archetypes[old_sig])
+
+    def use_storage(self, comp_cls, storage):
+        """Route a component type through a custom storage (see ColumnStore).
+
+        Components already in the world are migrated into the storage.
+        """
+        self.storages[comp_cls] = storage
+        self._view_types[storage.view_cls] = comp_cls
+        store = self.components.setdefault(comp_cls, {})
+        for e, comp in list(store.items()):
+            store[e] = storage.attach(e, comp)
+        for sig, arch in self._archetypes.items():
+            if comp_cls in sig:
+                self._invalidate(arch)
+        self.version += 1
+        return storage
+
+    def memory_report(self) -> dict:
+        """{component class name: {'count', 'bytes'}}; bytes are shallow sizes
+        (instance plus its __dict__, or column buffers for custom storage)."""
+        report = {}
+        for cls, store in self.components.items():
+            storage = self.storages.get(cls)
+            if storage is not None and hasattr(storage, 'nbytes'):
+                size = storage.nbytes()
+            else:
+                size = 0
+                for comp in store.values():
+                    size += sys.getsizeof(comp)
+                    d = getattr(comp, '__dict__', None)
+                    if d is not None:
+                        size += sys.getsizeof(d)
+            report[cls.__name__] = {'count': len(store), 'bytes': size}
+        return report
 
     def get(self, entity: EntityId, comp_cls):
         return self.components.get(comp_cls, {}).get(entity)
 
-    def query(self, *comp_classes):
-        stores = [self.components.get(c, {}) for c in comp_classes]
-        if not stores:
-            return
-        common = set(stores[0].keys())
-        for s in stores[1:]:
-            common &= set(s.keys())
-        for e in common:
-            yield (e, *[s[e] for s in stores])
+    def query(self, *comp_classes, exclude=()):
+        """Yield (entity, *components) for entities that have every class in
+        comp_classes and none in `exclude`."""
+        if not comp_classes:
+            return iter(())
+        key = (comp_classes, tuple(exclude))
+        q = self._queries.get(key)
+        if q is None:
+            q = self._build_query(key)
+        rows = q.rows
+        if rows is None:
+            stores = [self.components.get(c, {}) for c in comp_classes]
+            rows = q.rows = [
+                (e, *[s[e] for s in stores])
+                for arch in q.archetypes
+                for e in arch.entities
+            ]
+        # Structural changes replace q.rows rather than mutating it, so this
+        # iterator stays valid even if the caller adds components mid-loop.
+        return iter(rows)
+
+    def snapshot(self) -> Snapshot:
+        """Capture every component store and the entity allocator (not system state)."""
+        return Snapshot(self)
+
+    def restore(self, snapshot: Snapshot):
+        """Return to a snapshot; pending commands are dropped. Component
+        instances of surviving entities are updated in place."""
+        snapshot.apply(self)
+
+    def record_history(self, capacity: int = 120):
+        """Snapshot after every update, keeping the last `capacity` frames."""
+        self.history = SnapshotHistory(self, capacity)
+        return self.history
 
     def add_system(self, system):
         self.systems.append(system)
         self.systems.sort(key=lambda s: getattr(s, 'priority', 0))
 
+    def use_scheduler(self, max_workers: int | None = None):
+        """Run non-conflicting systems concurrently (see System.reads/writes)."""
+        if self.scheduler is not None:
+            self.scheduler.shutdown()
+        self.scheduler = Scheduler(self, max_workers)
+        return self.scheduler
+
+    def enable_profiling(self, budget_ms: float = 1000.0 / 60.0, window: int = 600, trace_frames: int = 300):
+        """Time every system each frame; see FrameProfiler for stats and trace export."""
+        self.profiler = FrameProfiler(budget_ms, window, trace_frames)
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+
+    def run_system(self, system, dt: float):
+        profiler = self.profiler
+        if profiler is None:
+            system.update(dt)
+            return
+        start = time.perf_counter_ns()
+        try:
+            system.update(dt)
+        finally:
+            profiler.record(type(system).__name__, start, time.perf_counter_ns())
+
     def update(self, dt: float):
-        for sys in self.systems:
-            sys.update(dt)
+        self.frame += 1
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame()
+        if self.scheduler is not None:
+            self.scheduler.run(dt)
+        else:
+            commands = self._commands
+            for system in self.systems:
+                self.run_system(system, dt)
+                if self.flush_between_systems and commands:
+                    commands.flush()
+            commands.flush()
+        if profiler is not None:
+            profiler.end_frame()
+        if self.history is not None:
+            self.history.capture()
+
+    # --- archetype bookkeeping ---
+    def _archetype(self, signature: frozenset) -> Archetype:
+        arch = self._archetypes.get(signature)
+        if arch is None:
+            arch = self._archetypes[signature] = Archetype(signature)
+            for q in self._queries.values():
+                if q.matches(signature):
+                    q.archetypes.append(arch)
+                    arch.queries.append(q)
+                    q.rows = None
+        return arch
+
+    def _build_query(self, key) -> _Query:
+        q = self._queries[key] = _Query(*key)
+        for sig, arch in self._archetypes.items():
+            if q.matches(sig):
+                q.archetypes.append(arch)
+                arch.queries.append(q)
+        return q
 
+    def _move(self, entity, old_sig: frozenset, new_sig: frozenset):
+        if old_sig:
+            old = self._archetypes[old_sig]
+            del old.entities[entity]
+            self._invalidate(old)
+        if new_sig:
+            new = self._archetype(new_sig)
+            new.entities[entity] = None
+            self._invalidate(new)
+            self._signatures[entity] = new_sig
+        else:
+            self._signatures.pop(entity, None)
 
+    @staticmethod
+    def _invalidate(arch: Archetype):
+        for q in arch.queries:
+            q.rows = None
@@ -0,0 +1,60 @@
+from ..ecs.system import System
+from .physics import Transform, Collider
+from .spatial import SpatialHash
+
+
+class Overlaps:
+    """Marker for System.reads/writes: the broadphase overlap pairs."""
+
+
+class BroadphaseSystem(System):
+    """Finds overlapping Transform + Collider boxes with a spatial hash.
+
+    After each update, `pairs` holds every overlapping (a, b) entity pair
+    (a < b) whose layers pass each other's masks, `began`/`ended` the pairs
+    that started or stopped overlapping this frame, and `contacts` maps
+    each entity to the entities it overlaps. Systems consuming these should
+    declare `reads = (Overlaps, ...)` so the scheduler orders them after it.
+    """
+    priority = 35
+    reads = (Transform, Collider)
+    writes = (Overlaps,)
+
+    def __init__(self, world, cell_size: float = 128):
+        super().__init__(world)
+        self.hash = SpatialHash(cell_size)
+        self.pairs = set()
+        self.began = set()
+        self.ended = set()
+        self.contacts = {}
+        self._colliders = {}
+        self._version = None
+
+    def update(self, dt: float):
+        world, grid, colliders = self.world, self.hash, self._colliders
+        for e, tr, col in world.query(Transform, Collider):
+            grid.update(e, tr.x, tr.y, col.w, col.h)
+            colliders[e] = col
+        if self._version != world.version:
+            # Entities may have lost their Transform/Collider or been destroyed
+            self._version = world.version
+            live = {row[0] for row in world.query(Transform, Collider)}
+            for e in [e for e in colliders if e not in live]:
+                grid.remove(e)
+                del colliders[e]
+
+        pairs = set()
+        contacts = {}
+        for a, b in grid.pairs():
+            ca, cb = colliders[a], colliders[b]
+            if ca.layer & cb.mask and cb.layer & ca.mask:
+                pairs.add((a, b))
+                contacts.setdefault(a, []).append(b)
+                contacts.setdefault(b, []).append(a)
+        self.began = pairs - self.pairs
+        self.ended = self.pairs - pairs
+        self.pairs = pairs
+        self.contacts = contacts
+
+    def overlapping(self, entity):
+        return self.contacts.get(entity, ())
@@ -0,0 +1,67 @@
+import pygame
+
+from .tilegrid import TileGrid
+
+
+def merge_cells(grid: TileGrid):
+    """Greedy-merge solid cells into maximal rectangles; returns (col, row, w, h) in cells.
+
+    Each run is taken as wide as possible along its row, then extended down
+    while the rows below are solid (and unclaimed) across the same span.
+    """
+    cols, rows, solid = grid.cols, grid.rows, grid.solid
+    used = bytearray(cols * rows)
+    out = []
+    for r in range(rows):
+        c = 0
+        while c < cols:
+            i = r * cols + c
+            if not solid[i] or used[i]:
+                c += 1
+                continue
+            end = c
+            while end < cols and solid[r * cols + end] and not used[r * cols + end]:
+                end += 1
+            w = end - c
+            bottom = r + 1
+            while bottom < rows:
+                start = bottom * cols + c
+                if not all(solid[start:start + w]) or any(used[start:start + w]):
+                    break
+                bottom += 1
+            for rr in range(r, bottom):
+                used[rr * cols + c:rr * cols + end] = b'\x01' * w
+            out.append((c, r, w, bottom - r))
+            c = end
+    return out
+
+
+class CompiledLevel:
+    """Level collision geometry: the TileGrid plus its merged rectangles.
+
+    `rects` hold the merged solid areas in pixels as compiled (later
+    set_solid edits do not update them); ChunkedTileRenderer.from_level
+    bakes its chunks from them. Collision does not use them:
+    TileCollisionSystem takes a CompiledLevel directly and sweeps its grid,
+    which has no seams between neighbouring solid cells, so bodies never
+    catch on ghost edges and none need flagging.
+    """
+
+    def __init__(self, grid: TileGrid):
+        self.grid = grid
+        self.cells = merge_cells(grid)
+        cs, ox, oy = grid.cell_size, grid.origin_x, grid.origin_y
+        self.rects = [pygame.Rect(ox + c * cs, oy + r * cs, w * cs, h * cs) for c, r, w, h in self.cells]
+
+    @classmethod
+    def from_ascii(cls, layout, cell_size: int, solid_chars: str = 'X') -> 'CompiledLevel':
+        return cls(TileGrid.from_ascii(layout, cell_size, solid_chars))
+
+    @classmethod
+    def from_rects(cls, rects, cell_size: int | None = None) -> 'CompiledLevel':
+        return cls(TileGrid.from_rects(rects, cell_size))
+
+
+def compile_level(layout, cell_size: int, solid_chars: str = 'X') -> CompiledLevel:
+    """Compile an ASCII level (as in levels/) into merged collision geometry."""
+    return CompiledLevel.from_ascii(layout, cell_size, solid_chars)
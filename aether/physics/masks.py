@@ -0,0 +1,77 @@
+import pygame
+
+
+class TileMaskCache:
+    """Pixel masks, outlines and debug overlays per tile id, built on first use.
+
+    `load(tile_id)` returns the tile's Surface (or None for empty tiles) and
+    `solid(tile_id)` says whether a tile takes part in collision. Everything
+    derived from a tile is computed once and shared by every layer and
+    entity test that uses the cache.
+    """
+
+    def __init__(self, load, solid=None):
+        self.load = load
+        self.solid = solid or (lambda tile_id: True)
+        self._masks = {}     # {tile_id: Mask or None}
+        self._outlines = {}  # {tile_id: [(x, y), ...]}
+        self._overlays = {}  # {(tile_id, color, width): (Surface, pad)}
+
+    def mask(self, tile_id):
+        """Collision mask for a tile, or None when it is empty or not solid."""
+        if tile_id not in self._masks:
+            surf = self.load(tile_id) if self.solid(tile_id) else None
+            self._masks[tile_id] = None if surf is None else pygame.mask.from_surface(surf)
+        return self._masks[tile_id]
+
+    def outline(self, tile_id):
+        points = self._outlines.get(tile_id)
+        if points is None:
+            mask = self.mask(tile_id)
+            points = self._outlines[tile_id] = mask.outline() if mask is not None else []
+        return points
+
+    def overlay(self, tile_id, color=(220, 40, 50), width: int = 2):
+        """(Surface, pad): the tile's outline pre-drawn on a transparent surface
+        `pad` pixels larger on each side; blit it at the tile position minus pad."""
+        key = (tile_id, color, width)
+        entry = self._overlays.get(key)
+        if entry is None:
+            points = self.outline(tile_id)
+            mask = self.mask(tile_id)
+            if mask is None or len(points) < 2:
+                entry = (None, 0)
+            else:
+                w, h = mask.get_size()
+                pad = width
+                surf = pygame.Surface((w + 2 * pad, h + 2 * pad), pygame.SRCALPHA)
+                pygame.draw.lines(surf, color, True, [(x + pad, y + pad) for x, y in points], width)
+                entry = (surf, pad)
+            self._overlays[key] = entry
+        return entry
+
+    def overlapping_tiles(self, tilemap, tile_size: int, mask, x: int, y: int):
+        """Yield (cx, cy) of every tile in `tilemap` (rows of ids) whose mask
+        overlaps `mask` placed with its top-left at (x, y)."""
+        w, h = mask.get_size()
+        rows = len(tilemap)
+        for cy in range(max(0, y // tile_size), min(rows - 1, (y + h - 1) // tile_size) + 1):
+            row = tilemap[cy]
+            for cx in range(max(0, x // tile_size), min(len(row) - 1, (x + w - 1) // tile_size) + 1):
+                tile_mask = self.mask(row[cx])
+                if tile_mask is not None and tile_mask.overlap(mask, (x - cx * tile_size, y - cy * tile_size)):
+                    yield cx, cy
+
+    def collides(self, tilemap, tile_size: int, mask, x: int, y: int) -> bool:
+        return next(self.overlapping_tiles(tilemap, tile_size, mask, x, y), None) is not None
+
+    def clear(self):
+        """Forget everything, e.g. after the tile surfaces change."""
+        self._masks.clear()
+        self._outlines.clear()
+        self._overlays.clear()
+
+
+def rect_mask(w: int, h: int):
+    """Solid mask for a box collider, to test against tile masks."""
+    return pygame.Mask((int(w), int(h)), fill=True)
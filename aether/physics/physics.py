@@ -1,36 +1,137 @@
-from ..ecs.component import Component
+import time
+
+from ..ecs.columns import ColumnQuery, ColumnStore
+from ..ecs.component import Component, component
 from ..ecs.system import System
 
 
+@component
 class Transform(Component):
-    def __init__(self, x=0.0, y=0.0):
-        self.x = float(x)
-        self.y = float(y)
+    x: float = 0.0
+    y: float = 0.0
 
 
+@component
 class Kinematics(Component):
-    def __init__(self):
-        self.vx = 0.0
-        self.vy = 0.0
-        self.ax = 0.0
-        self.ay = 0.0
-        self.on_ground = False
+    vx: float = 0.0
+    vy: float = 0.0
+    ax: float = 0.0
+    ay: float = 0.0
+    on_ground: bool = False
+    rest_time: float = 0.0   # seconds spent at rest; see platformer.SleepSystem
 
 
+@component
 class Collider(Component):
-    def __init__(self, w: int, h: int, solid: bool = True):
-        self.w = int(w)
-        self.h = int(h)
-        self.solid = bool(solid)
+    w: int
+    h: int
+    solid: bool = True
+    layer: int = 1           # bits this collider occupies
+    mask: int = 0xFFFFFFFF   # layers it reports overlaps with
+
+
+@component
+class Sleeping(Component):
+    """Tag for bodies at rest; physics systems exclude them from their queries."""
+
+
+@component
+class Substeps(Component):
+    """Per-entity integration rate for the physics systems.
+
+    The entity is stepped `count` times per update with dt / count (fast
+    bodies such as projectiles), and only on every `interval`-th frame with
+    interval * dt (slow or distant bodies). Entities without it take one
+    step per frame through the systems' regular path. TileCollisionSystem
+    moves sub-stepped bodies with its sub-pixel continuous sweep in either
+    mode, so the distance covered does not depend on `count`.
+    """
+    count: int = 1
+    interval: int = 1
+
+
+def wake(world, entity):
+    """Return a sleeping body to the active set (deferred through world.commands)."""
+    if world.get(entity, Sleeping) is not None:
+        world.commands.remove(entity, Sleeping)
+        kin = world.get(entity, Kinematics)
+        if kin is not None:
+            kin.rest_time = 0.0
+
+
+def use_columnar(world, capacity: int = 1024):
+    """Opt in to NumPy column storage for Transform, Kinematics and Collider.
+
+    `world.get`/`world.query` then return views backed by the columns; keep
+    using those rather than the instance originally passed to `world.add`.
+    """
+    for comp_cls in (Transform, Kinematics, Collider):
+        if not isinstance(world.storages.get(comp_cls), ColumnStore):
+            world.use_storage(comp_cls, ColumnStore(comp_cls, capacity=capacity))
+
+
+def is_columnar(world, *comp_classes) -> bool:
+    return all(isinstance(world.storages.get(c), ColumnStore) for c in comp_classes)
+
+
+def run_substeps(world, name: str, frame: int, dt: float, step, *comp_classes, exclude=()):
+    """Call step(sub_dt, entity, *components) for every entity with Substeps
+    due on this frame, as many times as it asks for; returns the step count.
+
+    Pass world.frame as `frame`, so every system picks the same frame for an
+    interval-N body however late it was added.
+
+    With profiling enabled the pass is timed as '<name>.substeps', and the
+    counters '<name>.substeps' (steps taken) and '<name>.substepped'
+    (entities) are recorded for the frame.
+    """
+    profiler = world.profiler
+    start = time.perf_counter_ns() if profiler is not None else 0
+    bodies = total = 0
+    for row in world.query(*comp_classes, Substeps, exclude=exclude):
+        sub = row[-1]
+        interval = max(1, sub.interval)
+        if (frame + row[0].index) % interval:
+            continue  # staggered by entity so interval-N bodies spread over N frames
+        steps = max(1, sub.count)
+        sub_dt = dt * interval / steps
+        args = row[:-1]
+        for _ in range(steps):
+            step(sub_dt, *args)
+        bodies += 1
+        total += steps
+    if profiler is not None and bodies:
+        profiler.record(f'{name}.substeps', start, time.perf_counter_ns())
+        profiler.count(f'{name}.substeps', total)
+        profiler.count(f'{name}.substepped', bodies)
+    return total
 
 
 class MovementSystem(System):
     priority = 20
+    reads = (Kinematics, Sleeping, Substeps)
+    writes = (Transform,)
 
-    def update(self, dt: float):
-        # Placeholder integration: vx/vy -> position
-        for e, tr, kin in self.world.query(Transform, Kinematics):
-            tr.x += kin.vx * dt
-            tr.y += kin.vy * dt
+    def __init__(self, world):
+        super().__init__(world)
+        self._columns = ColumnQuery(world, Transform, Kinematics, exclude=(Sleeping, Substeps))
 
+    def update(self, dt: float):
+        if is_columnar(self.world, Transform, Kinematics):
+            it, ik = self._columns.rows()
+            tc = self.world.storages[Transform].columns
+            kc = self.world.storages[Kinematics].columns
+            tc['x'][it] += kc['vx'][ik] * dt
+            tc['y'][it] += kc['vy'][ik] * dt
+        else:
+            # Placeholder integration: vx/vy -> position
+            for e, tr, kin in self.world.query(Transform, Kinematics, exclude=(Sleeping, Substeps)):
+                tr.x += kin.vx * dt
+                tr.y += kin.vy * dt
+        run_substeps(self.world, type(self).__name__, self.world.frame, dt, self._step,
+                     Transform, Kinematics, exclude=(Sleeping,))
 
+    @staticmethod
+    def _step(dt, e, tr, kin):
+        tr.x += kin.vx * dt
+        tr.y += kin.vy * dt
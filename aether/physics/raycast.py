@@ -0,0 +1,104 @@
+import numpy as np
+
+from .tilegrid import TileGrid
+
+
+def raycast_many(grid: TileGrid, x, y, dx, dy, max_dist=np.inf):
+    """TileGrid.raycast for many rays at once.
+
+    Arguments are scalars or arrays broadcastable to one shape; results are
+    flat (N,) arrays (cx, cy, distance), with cx = cy = -1 and distance inf
+    for rays without a hit. Rays are first clipped to the grid bounds, then
+    all of them take one DDA step per NumPy pass; finished rays are dropped
+    from the working set once they make up half of it. A pass costs about
+    as much as a few scalar casts, so below a few hundred rays a loop over
+    TileGrid.raycast is as fast.
+    """
+    x, y, dx, dy, max_dist = (v.ravel() for v in np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (x, y, dx, dy, max_dist))))
+    n = x.size
+    hit_cx = np.full(n, -1, dtype=np.intp)
+    hit_cy = np.full(n, -1, dtype=np.intp)
+    hit_t = np.full(n, np.inf)
+
+    cs, cols, rows = grid.cell_size, grid.cols, grid.rows
+    length = np.hypot(dx, dy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ux, uy = dx / length, dy / length
+        gx, gy = (x - grid.origin_x) / cs, (y - grid.origin_y) / cs
+        # Part of each ray inside the grid bounds, as distances in pixels
+        enter_x, leave_x = _slab(gx, ux, cols, cs)
+        enter_y, leave_y = _slab(gy, uy, rows, cs)
+    enter = np.maximum(np.maximum(enter_x, enter_y), 0.0)
+    limit = np.minimum(np.minimum(leave_x, leave_y), max_dist)
+    ids = np.flatnonzero((length > 0) & (enter <= limit))
+    if not ids.size:
+        return hit_cx, hit_cy, hit_t
+
+    # Occupancy with a one-cell border of 2s: a ray stepping out of the grid
+    # lands on the border, so each step needs a single lookup
+    pc = cols + 2
+    cells = np.full((rows + 2, pc), 2, dtype=np.uint8)
+    cells[1:-1, 1:-1] = np.frombuffer(grid.solid, dtype=np.uint8).reshape(rows, cols) != 0
+    cells = cells.ravel()
+
+    ux, uy, gx, gy, t, limit = (v[ids] for v in (ux, uy, gx, gy, enter, limit))
+    cx = np.clip(np.floor(gx + ux * t / cs), 0, cols - 1).astype(np.intp)
+    cy = np.clip(np.floor(gy + uy * t / cs), 0, rows - 1).astype(np.intp)
+    step_x = np.where(ux > 0, 1, -1)
+    step_y = np.where(uy > 0, 1, -1) * pc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_max_x = np.where(ux != 0, (cx + (ux > 0) - gx) * cs / ux, np.inf)
+        t_max_y = np.where(uy != 0, (cy + (uy > 0) - gy) * cs / uy, np.inf)
+        t_delta_x = np.where(ux != 0, cs / np.abs(ux), np.inf)
+        t_delta_y = np.where(uy != 0, cs / np.abs(uy), np.inf)
+    cell = (cy + 1) * pc + cx + 1
+    active = np.ones(ids.size, dtype=bool)
+
+    while True:
+        value = cells[cell]
+        hit = active & (value == 1) & (t <= limit)
+        if hit.any():
+            out = ids[hit]
+            flat = cell[hit]
+            hit_cx[out] = flat % pc - 1
+            hit_cy[out] = flat // pc - 1
+            hit_t[out] = t[hit]
+        active &= ~hit & (value != 2) & (t <= limit)
+        remaining = np.count_nonzero(active)
+        if not remaining:
+            break
+        if remaining * 2 < active.size:
+            keep = active
+            ids, cell, t, limit = ids[keep], cell[keep], t[keep], limit[keep]
+            step_x, step_y = step_x[keep], step_y[keep]
+            t_max_x, t_max_y = t_max_x[keep], t_max_y[keep]
+            t_delta_x, t_delta_y = t_delta_x[keep], t_delta_y[keep]
+            active = np.ones(ids.size, dtype=bool)
+        along_x = t_max_x < t_max_y
+        t = np.where(along_x, t_max_x, t_max_y)
+        cell = cell + np.where(along_x, step_x, step_y) * active  # finished rays stay put
+        t_max_x = np.where(along_x, t_max_x + t_delta_x, t_max_x)
+        t_max_y = np.where(along_x, t_max_y, t_max_y + t_delta_y)
+
+    return hit_cx, hit_cy, hit_t
+
+
+def line_of_sight_many(grid: TileGrid, ax, ay, bx, by):
+    """Boolean array: TileGrid.line_of_sight for many point pairs."""
+    ax, ay, bx, by = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (ax, ay, bx, by)))
+    dx, dy = bx - ax, by - ay
+    dist = np.hypot(dx, dy)
+    _, _, t = raycast_many(grid, ax, ay, dx, dy, dist)
+    return ((t >= dist.ravel()) | (dist.ravel() == 0)).reshape(dist.shape)
+
+
+def _slab(g, u, cells, cs):
+    """Distances at which rays enter and leave [0, cells) along one axis."""
+    t0 = (0 - g) * cs / u
+    t1 = (cells - g) * cs / u
+    parallel = u == 0
+    inside = (g >= 0) & (g < cells)
+    enter = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t0, t1))
+    leave = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t0, t1))
+    return enter, leave
@@ -0,0 +1,87 @@
+class SpatialHash:
+    """Uniform-grid spatial hash over axis-aligned boxes, keyed by any hashable.
+
+    Boxes are re-bucketed only when they cross into a different set of
+    cells, so moving an object within its cells costs one tuple compare.
+    """
+
+    def __init__(self, cell_size: float = 128):
+        self.cell_size = cell_size
+        self.cells = {}    # {(cx, cy): set of keys}
+        self.bounds = {}   # {key: (x, y, w, h)}
+        self._ranges = {}  # {key: (cx0, cy0, cx1, cy1)}
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, key):
+        return key in self.bounds
+
+    def update(self, key, x: float, y: float, w: float, h: float):
+        """Insert or move a box."""
+        self.bounds[key] = (x, y, w, h)
+        cs = self.cell_size
+        rng = (int(x // cs), int(y // cs), int((x + w) // cs), int((y + h) // cs))
+        old = self._ranges.get(key)
+        if old == rng:
+            return
+        if old is not None:
+            self._unlink(key, old)
+        self._ranges[key] = rng
+        cells = self.cells
+        for cy in range(rng[1], rng[3] + 1):
+            for cx in range(rng[0], rng[2] + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {key}
+                else:
+                    bucket.add(key)
+
+    insert = update
+
+    def remove(self, key):
+        rng = self._ranges.pop(key, None)
+        if rng is not None:
+            self._unlink(key, rng)
+            del self.bounds[key]
+
+    def query(self, x: float, y: float, w: float, h: float) -> set:
+        """Keys whose boxes overlap the given box."""
+        cs = self.cell_size
+        found = set()
+        cells, bounds = self.cells, self.bounds
+        for cy in range(int(y // cs), int((y + h) // cs) + 1):
+            for cx in range(int(x // cs), int((x + w) // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return {k for k in found if _overlap(bounds[k], (x, y, w, h))}
+
+    def pairs(self):
+        """Every unordered pair of overlapping boxes, once, as (a, b)."""
+        bounds = self.bounds
+        seen = set()
+        for bucket in self.cells.values():
+            if len(bucket) < 2:
+                continue
+            keys = list(bucket)
+            for i, a in enumerate(keys):
+                ba = bounds[a]
+                for b in keys[i + 1:]:
+                    pair = (a, b) if a < b else (b, a)
+                    if pair not in seen and _overlap(ba, bounds[b]):
+                        seen.add(pair)
+        return seen
+
+    def _unlink(self, key, rng):
+        cells = self.cells
+        for cy in range(rng[1], rng[3] + 1):
+            for cx in range(rng[0], rng[2] + 1):
+                bucket = cells[(cx, cy)]
+                bucket.discard(key)
+                if not bucket:
+                    del cells[(cx, cy)]
+
+
+def _overlap(a, b) -> bool:
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
@@ -0,0 +1,244 @@
+from functools import reduce
+from math import ceil, floor, gcd, hypot, inf
+
+import pygame
+
+
+class TileGrid:
+    """Uniform grid of solid/empty cells for level collision.
+
+    `solid` is a row-major bytearray (non-zero = solid) so lookups are a
+    single index; cells outside the grid count as empty. Callables in
+    `listeners` are called with (cx, cy) whenever set_solid changes a cell.
+    """
+
+    def __init__(self, cols: int, rows: int, cell_size: int, origin=(0, 0), solid=None):
+        self.cols = int(cols)
+        self.rows = int(rows)
+        self.cell_size = int(cell_size)
+        self.origin_x, self.origin_y = int(origin[0]), int(origin[1])
+        self.solid = bytearray(self.cols * self.rows) if solid is None else bytearray(solid)
+        if len(self.solid) != self.cols * self.rows:
+            raise ValueError('solid must hold cols * rows cells')
+        self.listeners = []
+
+    @classmethod
+    def from_ascii(cls, layout, cell_size: int, solid_chars: str = 'X') -> 'TileGrid':
+        """Grid from an ASCII level (rows of characters, as in levels/ and settings)."""
+        cols = max((len(row) for row in layout), default=0)
+        grid = cls(cols, len(layout), cell_size)
+        for r, row in enumerate(layout):
+            for c, ch in enumerate(row):
+                if ch in solid_chars:
+                    grid.solid[r * cols + c] = 1
+        return grid
+
+    @classmethod
+    def from_tilemap(cls, tilemap, cell_size: int, solid_ids) -> 'TileGrid':
+        """Grid from rows of tile ids, marking the ids in `solid_ids` solid."""
+        solid_ids = set(solid_ids)
+        cols = max((len(row) for row in tilemap), default=0)
+        grid = cls(cols, len(tilemap), cell_size)
+        for r, row in enumerate(tilemap):
+            for c, tile_id in enumerate(row):
+                if tile_id in solid_ids:
+                    grid.solid[r * cols + c] = 1
+        return grid
+
+    @classmethod
+    def from_rects(cls, rects, cell_size: int | None = None) -> 'TileGrid':
+        """Rasterise axis-aligned rects onto a grid that represents them exactly.
+
+        Without `cell_size` the cell is the gcd of every rect's position and
+        size relative to the top-left of their bounds, so a list of 64x64
+        tiles becomes a 64px grid. Raises ValueError rather than rasterising
+        at a few pixels when the rects do not share a grid: a gcd under half
+        the shortest rect side (a 100x10 platform among 64px tiles would
+        give 2px cells), or rects not aligned to an explicit `cell_size`.
+        """
+        rects = [pygame.Rect(r) for r in rects]
+        if not rects:
+            return cls(0, 0, cell_size or 1)
+        left = min(r.left for r in rects)
+        top = min(r.top for r in rects)
+        right = max(r.right for r in rects)
+        bottom = max(r.bottom for r in rects)
+        offsets = [(r, (r.x - left, r.y - top, r.w, r.h)) for r in rects]
+        if cell_size is None:
+            cell = reduce(gcd, (v for _, vs in offsets for v in vs), 0) or 1
+            shortest = min(min(r.w, r.h) for r in rects)
+            if cell * 2 < shortest:
+                raise ValueError(f'rects do not share a grid (they only align to {cell}px cells); '
+                                 f'pass cell_size or build the TileGrid directly')
+        else:
+            cell = int(cell_size)
+            for r, vs in offsets:
+                if any(v % cell for v in vs):
+                    raise ValueError(f'{r} is not aligned to {cell}px cells from ({left}, {top})')
+        grid = cls((right - left) // cell, (bottom - top) // cell, cell, origin=(left, top))
+        for r in rects:
+            c0, r0 = (r.x - left) // cell, (r.y - top) // cell
+            for row in range(r0, r0 + r.h // cell):
+                start = row * grid.cols + c0
+                grid.solid[start:start + r.w // cell] = b'\x01' * (r.w // cell)
+        return grid
+
+    def is_solid(self, cx: int, cy: int) -> bool:
+        return 0 <= cx < self.cols and 0 <= cy < self.rows and self.solid[cy * self.cols + cx] != 0
+
+    def set_solid(self, cx: int, cy: int, value: bool = True):
+        i = cy * self.cols + cx
+        new = 1 if value else 0
+        if self.solid[i] != new:
+            self.solid[i] = new
+            for listener in self.listeners:
+                listener(cx, cy)
+
+    def cell_at(self, x: float, y: float):
+        cs = self.cell_size
+        return int((x - self.origin_x) // cs), int((y - self.origin_y) // cs)
+
+    def cell_rect(self, cx: int, cy: int) -> pygame.Rect:
+        cs = self.cell_size
+        return pygame.Rect(self.origin_x + cx * cs, self.origin_y + cy * cs, cs, cs)
+
+    def rects(self):
+        """One rect per solid cell."""
+        cols = self.cols
+        return [self.cell_rect(i % cols, i // cols) for i, v in enumerate(self.solid) if v]
+
+    def first_solid_row(self, left: int, right: int, top: int, bottom: int, downward: bool):
+        """First row (scanning down or up) with a solid cell in pixel span [left, right) x [top, bottom)."""
+        span = self._span(left, right, top, bottom)
+        if span is None:
+            return None
+        c0, c1, r0, r1 = span
+        cols, solid = self.cols, self.solid
+        rows = range(r0, r1 + 1) if downward else range(r1, r0 - 1, -1)
+        for r in rows:
+            if any(solid[r * cols + c0:r * cols + c1 + 1]):
+                return r
+        return None
+
+    def first_solid_col(self, left: int, right: int, top: int, bottom: int, rightward: bool):
+        """First column (scanning right or left) with a solid cell in pixel span [left, right) x [top, bottom)."""
+        span = self._span(left, right, top, bottom)
+        if span is None:
+            return None
+        c0, c1, r0, r1 = span
+        cols, solid = self.cols, self.solid
+        columns = range(c0, c1 + 1) if rightward else range(c1, c0 - 1, -1)
+        for c in columns:
+            if any(solid[r0 * cols + c:r1 * cols + c + 1:cols]):
+                return c
+        return None
+
+    def sweep_y(self, x: float, y: float, w: float, h: float, dy: float):
+        """Move box (x, y, w, h) by dy until its leading edge meets a solid row.
+
+        Returns (allowed_dy, row) with row None when the path is clear. Every
+        column under the leading edge is tested, so landing across several
+        tiles resolves as one contact; touching boxes do not count as overlap.
+        allowed_dy can be smaller than 0 for an upward push out of a row the
+        edge has already sunk into.
+        """
+        if dy == 0:
+            return 0.0, None
+        cs, oy = self.cell_size, self.origin_y
+        c0 = max(0, floor((x - self.origin_x) / cs))
+        c1 = min(self.cols - 1, ceil((x + w - self.origin_x) / cs) - 1)
+        if c0 > c1:
+            return dy, None
+        cols, solid = self.cols, self.solid
+        if dy > 0:
+            edge = y + h
+            rows = range(max(0, floor((edge - oy) / cs)), min(self.rows - 1, ceil((edge + dy - oy) / cs) - 1) + 1)
+        else:
+            edge = y
+            rows = range(min(self.rows - 1, ceil((edge - oy) / cs) - 1), max(0, floor((edge + dy - oy) / cs)) - 1, -1)
+        for r in rows:
+            if any(solid[r * cols + c0:r * cols + c1 + 1]):
+                face = oy + r * cs if dy > 0 else oy + (r + 1) * cs
+                return face - edge, r
+        return dy, None
+
+    def sweep_x(self, x: float, y: float, w: float, h: float, dx: float):
+        """Horizontal counterpart of sweep_y; returns (allowed_dx, col)."""
+        if dx == 0:
+            return 0.0, None
+        cs, ox = self.cell_size, self.origin_x
+        r0 = max(0, floor((y - self.origin_y) / cs))
+        r1 = min(self.rows - 1, ceil((y + h - self.origin_y) / cs) - 1)
+        if r0 > r1:
+            return dx, None
+        cols, solid = self.cols, self.solid
+        if dx > 0:
+            edge = x + w
+            columns = range(max(0, floor((edge - ox) / cs)), min(self.cols - 1, ceil((edge + dx - ox) / cs) - 1) + 1)
+        else:
+            edge = x
+            columns = range(min(self.cols - 1, ceil((edge - ox) / cs) - 1), max(0, floor((edge + dx - ox) / cs)) - 1, -1)
+        for c in columns:
+            if any(solid[r0 * cols + c:r1 * cols + c + 1:cols]):
+                face = ox + c * cs if dx > 0 else ox + (c + 1) * cs
+                return face - edge, c
+        return dx, None
+
+    def raycast(self, x: float, y: float, dx: float, dy: float, max_dist: float = inf):
+        """First solid cell along the ray from (x, y) in direction (dx, dy).
+
+        Walks the cells the ray crosses in order (DDA), so the cost is the
+        number of cells up to the hit. Returns (cx, cy, distance) with the
+        distance in pixels to where the ray enters the cell (0 when it starts
+        inside one), or None if nothing solid lies within max_dist.
+        """
+        length = hypot(dx, dy)
+        if length == 0:
+            return None
+        dx, dy = dx / length, dy / length
+        cs = self.cell_size
+        gx, gy = (x - self.origin_x) / cs, (y - self.origin_y) / cs
+        cx, cy = floor(gx), floor(gy)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Distance along the ray to the next vertical / horizontal grid line, and between lines
+        t_max_x = (cx + (dx > 0) - gx) * cs / dx if dx else inf
+        t_max_y = (cy + (dy > 0) - gy) * cs / dy if dy else inf
+        t_delta_x = cs / abs(dx) if dx else inf
+        t_delta_y = cs / abs(dy) if dy else inf
+        cols, rows, solid = self.cols, self.rows, self.solid
+        t = 0.0
+        while t <= max_dist:
+            if 0 <= cx < cols and 0 <= cy < rows:
+                if solid[cy * cols + cx]:
+                    return cx, cy, t
+            elif ((cx < 0 and step_x < 0) or (cx >= cols and step_x > 0) or (not dx and not 0 <= cx < cols)
+                  or (cy < 0 and step_y < 0) or (cy >= rows and step_y > 0) or (not dy and not 0 <= cy < rows)):
+                return None  # outside the grid and moving away from it
+            if t_max_x < t_max_y:
+                t = t_max_x
+                t_max_x += t_delta_x
+                cx += step_x
+            else:
+                t = t_max_y
+                t_max_y += t_delta_y
+                cy += step_y
+        return None
+
+    def line_of_sight(self, ax: float, ay: float, bx: float, by: float) -> bool:
+        """True when no solid cell lies on the segment between the two points."""
+        dist = hypot(bx - ax, by - ay)
+        if dist == 0:
+            return True
+        hit = self.raycast(ax, ay, bx - ax, by - ay, dist)
+        return hit is None or hit[2] >= dist  # a cell starting exactly at b does not block
+
+    def _span(self, left, right, top, bottom):
+        cs = self.cell_size
+        c0 = max(0, (left - self.origin_x) // cs)
+        c1 = min(self.cols - 1, (right - 1 - self.origin_x) // cs)
+        r0 = max(0, (top - self.origin_y) // cs)
+        r1 = min(self.rows - 1, (bottom - 1 - self.origin_y) // cs)
+        if c0 > c1 or r0 > r1:
+            return None
+        return c0, c1, r0, r1
@@ -1,38 +1,50 @@
-from ..ecs.component import Component
+from ..ecs.columns import ColumnStore
+from ..ecs.component import Component, component
+from ..physics import physics
 
 
+@component
 class Controller(Component):
-    def __init__(self):
-        self.left = False
-        self.right = False
-        self.jump_pressed = False  # edge
+    left: bool = False
+    right: bool = False
+    jump_pressed: bool = False  # edge
 
 
+@component
 class Params(Component):
-    def __init__(self, speed=360.0, accel=18.0, max_speed=260.0,
-                 gravity=1500.0, jump_speed=-600.0,
-                 friction_ground=12.0, friction_air=2.0,
-                 coyote_time=0.12, jump_buffer=0.10):
-        self.speed = speed
-        self.accel = accel
-        self.max_speed = max_speed
-        self.gravity = gravity
-        self.jump_speed = jump_speed
-        self.friction_ground = friction_ground
-        self.friction_air = friction_air
-        self.coyote_time = coyote_time
-        self.jump_buffer = jump_buffer
-
-
+    speed: float = 360.0
+    accel: float = 18.0
+    max_speed: float = 260.0
+    gravity: float = 1500.0
+    jump_speed: float = -600.0
+    friction_ground: float = 12.0
+    friction_air: float = 2.0
+    coyote_time: float = 0.12
+    jump_buffer: float = 0.10
+    sleep_delay: float = 0.5   # seconds at rest before the body sleeps
+    sleep_speed: float = 2.0   # |vx| below this counts as stopped
+
+
+@component
 class JumpState(Component):
-    def __init__(self):
-        self.on_ground = False
-        self.was_on_ground = False
-        self.coyote = 0.0
-        self.buffer = 0.0
+    on_ground: bool = False
+    was_on_ground: bool = False
+    coyote: float = 0.0
+    buffer: float = 0.0
 
 
+@component
 class PlayerTag(Component):
     pass
 
 
+def use_columnar(world, capacity: int = 1024):
+    """Opt in to NumPy column storage for every component MovementSystem reads.
+
+    With all of them columnar, platformer.MovementSystem runs as whole-array
+    operations instead of a per-entity loop.
+    """
+    physics.use_columnar(world, capacity)
+    for comp_cls in (Controller, Params, JumpState):
+        if not isinstance(world.storages.get(comp_cls), ColumnStore):
+            world.use_storage(comp_cls, ColumnStore(comp_cls, capacity=capacity))
@@ -1,12 +1,19 @@
-import pygame
+import numpy as np
 
+from ..ecs.columns import ColumnQuery
 from ..ecs.system import System
-from ..physics.physics import Transform, Kinematics, Collider
+from ..physics.physics import Transform, Kinematics, Collider, Sleeping, Substeps, is_columnar, run_substeps, wake
+from ..physics.broadphase import Overlaps
+from ..physics.level import CompiledLevel
+from ..physics.tilebatch import TileOccupancy, collide_tiles
+from ..physics.tilegrid import TileGrid
 from .components import Controller, Params, JumpState
 
 
 class InputSystem(System):
     priority = 10
+    reads = ()
+    writes = (Controller, Kinematics, Sleeping)  # wake() resets Kinematics.rest_time
     def __init__(self, world, input_mgr):
         super().__init__(world)
         self.input = input_mgr
@@ -18,81 +25,276 @@ class InputSystem(System):
             ctrl.left = left
             ctrl.right = right
             ctrl.jump_pressed = self.input.was_pressed('jump')
+        # Input wakes sleeping bodies before MovementSystem runs
+        for e, ctrl, _ in self.world.query(Controller, Sleeping):
+            if ctrl.left or ctrl.right or ctrl.jump_pressed:
+                wake(self.world, e)
 
 
 class MovementSystem(System):
     priority = 20
+    reads = (Transform, Controller, Params, Sleeping, Substeps)
+    writes = (Kinematics, JumpState)
+    def __init__(self, world):
+        super().__init__(world)
+        self._columns = ColumnQuery(world, Transform, Kinematics, Controller, Params, JumpState, exclude=(Sleeping, Substeps))
+
     def update(self, dt: float):
-        for e, tr, kin, ctrl, prm, js in self.world.query(Transform, Kinematics, Controller, Params, JumpState):
-            target = (-1.0 if ctrl.left else 0.0) + (1.0 if ctrl.right else 0.0)
-            desired_vx = target * prm.speed
-            kin.vx += (desired_vx - kin.vx) * min(1.0, prm.accel * dt)
+        if is_columnar(self.world, Transform, Kinematics, Controller, Params, JumpState):
+            self._update_columns(dt)
+        else:
+            for row in self.world.query(Transform, Kinematics, Controller, Params, JumpState, exclude=(Sleeping, Substeps)):
+                self._step(dt, *row)
+        run_substeps(self.world, type(self).__name__, self.world.frame, dt, self._step,
+                     Transform, Kinematics, Controller, Params, JumpState, exclude=(Sleeping,))
+
+    @staticmethod
+    def _step(dt, e, tr, kin, ctrl, prm, js):
+        target = (-1.0 if ctrl.left else 0.0) + (1.0 if ctrl.right else 0.0)
+        desired_vx = target * prm.speed
+        kin.vx += (desired_vx - kin.vx) * min(1.0, prm.accel * dt)
+
+        damp = prm.friction_ground if js.on_ground else prm.friction_air
+        kin.vx += (-kin.vx) * min(1.0, damp * dt)
+
+        kin.vx = max(-prm.max_speed, min(prm.max_speed, kin.vx))
+        kin.vy += prm.gravity * dt
+
+        if ctrl.jump_pressed:
+            js.buffer = prm.jump_buffer
 
-            damp = prm.friction_ground if js.on_ground else prm.friction_air
-            kin.vx += (-kin.vx) * min(1.0, damp * dt)
+        if js.buffer > 0.0 and (js.on_ground or js.coyote > 0.0):
+            kin.vy = prm.jump_speed
+            js.on_ground = False
+            js.coyote = 0.0
+            js.buffer = 0.0
 
-            kin.vx = max(-prm.max_speed, min(prm.max_speed, kin.vx))
-            kin.vy += prm.gravity * dt
+        # Do not integrate position here; collision system will apply axis-wise movement
 
-            if ctrl.jump_pressed:
-                js.buffer = prm.jump_buffer
+        # Timers
+        if js.was_on_ground and not js.on_ground and js.coyote <= 0.0:
+            js.coyote = prm.coyote_time
+        if js.on_ground:
+            js.coyote = 0.0
+        else:
+            js.coyote = max(0.0, js.coyote - dt)
+        js.buffer = max(0.0, js.buffer - dt)
+        js.was_on_ground = js.on_ground
 
-            if js.buffer > 0.0 and (js.on_ground or js.coyote > 0.0):
-                kin.vy = prm.jump_speed
-                js.on_ground = False
-                js.coyote = 0.0
-                js.buffer = 0.0
+    def _update_columns(self, dt: float):
+        # Same rules as the loop above, applied to every body at once
+        _, ik, ic, ip, ij = self._columns.rows()
+        storages = self.world.storages
+        kc = storages[Kinematics].columns
+        cc = storages[Controller].columns
+        pc = storages[Params].columns
+        jc = storages[JumpState].columns
 
-            # Do not integrate position here; collision system will apply axis-wise movement
+        on_ground = jc['on_ground'][ij]
+        target = cc['right'][ic].astype(np.float64) - cc['left'][ic]
+        vx = kc['vx'][ik]
+        vx = vx + (target * pc['speed'][ip] - vx) * np.minimum(1.0, pc['accel'][ip] * dt)
+        damp = np.where(on_ground, pc['friction_ground'][ip], pc['friction_air'][ip])
+        vx = vx - vx * np.minimum(1.0, damp * dt)
+        max_speed = pc['max_speed'][ip]
+        vx = np.clip(vx, -max_speed, max_speed)
+        vy = kc['vy'][ik] + pc['gravity'][ip] * dt
 
-            # Timers
-            if js.was_on_ground and not js.on_ground and js.coyote <= 0.0:
-                js.coyote = prm.coyote_time
-            if js.on_ground:
-                js.coyote = 0.0
-            else:
-                js.coyote = max(0.0, js.coyote - dt)
-            js.buffer = max(0.0, js.buffer - dt)
-            js.was_on_ground = js.on_ground
+        buffer = np.where(cc['jump_pressed'][ic], pc['jump_buffer'][ip], jc['buffer'][ij])
+        coyote = jc['coyote'][ij]
+        jump = (buffer > 0.0) & (on_ground | (coyote > 0.0))
+        vy = np.where(jump, pc['jump_speed'][ip], vy)
+        on_ground = on_ground & ~jump
+        coyote = np.where(jump, 0.0, coyote)
+        buffer = np.where(jump, 0.0, buffer)
+
+        left_ground = jc['was_on_ground'][ij] & ~on_ground & (coyote <= 0.0)
+        coyote = np.where(left_ground, pc['coyote_time'][ip], coyote)
+        coyote = np.where(on_ground, 0.0, np.maximum(0.0, coyote - dt))
+
+        kc['vx'][ik] = vx
+        kc['vy'][ik] = vy
+        jc['on_ground'][ij] = on_ground
+        jc['was_on_ground'][ij] = on_ground
+        jc['coyote'][ij] = coyote
+        jc['buffer'][ij] = np.maximum(0.0, buffer - dt)
 
 
 class TileCollisionSystem(System):
     priority = 30
-    def __init__(self, world, tiles):
+    reads = (Collider, Sleeping, Substeps)
+    writes = (Transform, Kinematics, JumpState)
+    def __init__(self, world, tiles, continuous: bool = False):
+        super().__init__(world)
+        # TileGrid, CompiledLevel, or a list of pygame.Rect converted to a grid
+        if isinstance(tiles, CompiledLevel):
+            tiles = tiles.grid
+        self.grid = tiles if isinstance(tiles, TileGrid) else TileGrid.from_rects(tiles)
+        # Continuous mode keeps sub-pixel positions and stops each axis at its
+        # time of impact instead of truncating the step to whole pixels
+        self.continuous = continuous
+        self._columns = ColumnQuery(world, Transform, Kinematics, Collider, JumpState, exclude=(Sleeping, Substeps))
+        self._occupancy = None
+
+    def _set_tiles(self, tiles):
+        self.grid = TileGrid.from_rects(tiles)
+
+    # Assign-only: a new list of rects replaces the grid. Mutating a list
+    # after passing it in has no effect, so there is no getter to hand one
+    # out; edit self.grid (set_solid) instead.
+    tiles = property(None, _set_tiles)
+
+    def update(self, dt: float):
+        step = self._step_continuous if self.continuous else self._step
+        if not self.continuous and is_columnar(self.world, Transform, Kinematics, Collider, JumpState):
+            self._update_columns(dt)
+        else:
+            for row in self.world.query(Transform, Kinematics, Collider, JumpState, exclude=(Sleeping, Substeps)):
+                step(dt, *row)
+        # Sub-steps always sweep: whole-pixel truncation would drop most of a
+        # short sub-step's motion, slowing bodies down as count grows
+        run_substeps(self.world, type(self).__name__, self.world.frame, dt, self._step_continuous,
+                     Transform, Kinematics, Collider, JumpState, exclude=(Sleeping,))
+
+    def _update_columns(self, dt: float):
+        # Whole-array version of _step for columnar worlds (see collide_tiles)
+        if self._occupancy is None or self._occupancy.grid is not self.grid:
+            self._occupancy = TileOccupancy(self.grid)
+        it, ik, ic, ij = self._columns.rows()
+        storages = self.world.storages
+        tc = storages[Transform].columns
+        kc = storages[Kinematics].columns
+        cc = storages[Collider].columns
+        x, y, vx, vy, on_ground = collide_tiles(
+            self._occupancy, tc['x'][it], tc['y'][it], cc['w'][ic], cc['h'][ic], kc['vx'][ik], kc['vy'][ik], dt)
+        tc['x'][it] = x
+        tc['y'][it] = y
+        kc['vx'][ik] = vx
+        kc['vy'][ik] = vy
+        storages[JumpState].columns['on_ground'][ij] = on_ground
+
+    def _step(self, dt, e, tr, kin, col, js):
+        grid = self.grid
+        cs = grid.cell_size
+        x, y, w, h = int(tr.x), int(tr.y), col.w, col.h
+        # Vertical movement and resolve first; cells swept between the old
+        # and new box are tested so a long step cannot skip a thin platform
+        ny = y + int(kin.vy * dt)
+        collided_v = False
+        if kin.vy > 0:
+            row = grid.first_solid_row(x, x + w, y, ny + h, downward=True)
+            if row is not None:
+                ny = grid.origin_y + row * cs - h
+                kin.vy = 0.0
+                js.on_ground = True
+                collided_v = True
+        elif kin.vy < 0:
+            row = grid.first_solid_row(x, x + w, ny, y + h, downward=False)
+            if row is not None:
+                ny = grid.origin_y + (row + 1) * cs
+                kin.vy = 0.0
+        if not collided_v:
+            js.on_ground = False
+
+        # Horizontal movement and resolve
+        nx = x + int(kin.vx * dt)
+        if kin.vx > 0:
+            c = grid.first_solid_col(x, nx + w, ny, ny + h, rightward=True)
+            if c is not None:
+                nx = grid.origin_x + c * cs - w
+                kin.vx = 0.0
+        elif kin.vx < 0:
+            c = grid.first_solid_col(nx, x + w, ny, ny + h, rightward=False)
+            if c is not None:
+                nx = grid.origin_x + (c + 1) * cs
+                kin.vx = 0.0
+
+        tr.x, tr.y = nx, ny
+
+    def _step_continuous(self, dt, e, tr, kin, col, js):
+        grid = self.grid
+        x, y, w, h = tr.x, tr.y, col.w, col.h
+        # Vertical first, then horizontal from the resolved height
+        dy, row = grid.sweep_y(x, y, w, h, kin.vy * dt)
+        y += dy
+        js.on_ground = row is not None and kin.vy > 0
+        if row is not None:
+            kin.vy = 0.0
+        dx, c = grid.sweep_x(x, y, w, h, kin.vx * dt)
+        x += dx
+        if c is not None:
+            kin.vx = 0.0
+        tr.x, tr.y = x, y
+
+
+_DEFAULT_PARAMS = Params()
+
+
+class SleepSystem(System):
+    """Moves resting bodies out of the active set and wakes them again.
+
+    A Transform + Kinematics body that has not moved since the previous
+    frame, with |vx| below Params.sleep_speed, no controller input and no
+    buffered jump accumulates Kinematics.rest_time; after Params.sleep_delay
+    its velocity is zeroed and it is tagged Sleeping, which the movement and
+    collision systems exclude. Bodies without Controller or JumpState count
+    as having no input, and without Params use its defaults.
+    Sleepers wake on input (InputSystem), on a new broadphase overlap, and
+    when a grid tile within one cell of their box changes.
+    """
+    priority = 40
+    reads = (Transform, Collider, Controller, Params, JumpState)
+    writes = (Kinematics, Sleeping)
+
+    def __init__(self, world, grid: TileGrid | None = None, broadphase=None):
         super().__init__(world)
-        self.tiles = tiles  # list of pygame.Rect
+        self.broadphase = broadphase
+        if broadphase is not None:
+            self.reads = self.reads + (Overlaps,)  # broadphase.began
+        self.grid = grid
+        self._last = {}     # {entity: (x, y)} for active bodies, previous frame
+        self._changed = []  # tile cells set since the last update
+        if grid is not None:
+            grid.listeners.append(lambda cx, cy: self._changed.append((cx, cy)))
 
     def update(self, dt: float):
-        for e, tr, kin, col, js in self.world.query(Transform, Kinematics, Collider, JumpState):
-            ent = pygame.Rect(int(tr.x), int(tr.y), col.w, col.h)
-            # Vertical movement and resolve first
-            ent.y += int(kin.vy * dt)
-            collided_v = False
-            for t in self.tiles:
-                if ent.colliderect(t):
-                    if kin.vy > 0:
-                        ent.bottom = t.top
-                        kin.vy = 0.0
-                        js.on_ground = True
-                        collided_v = True
-                    elif kin.vy < 0:
-                        ent.top = t.bottom
-                        kin.vy = 0.0
-                    break
-            if not collided_v:
-                js.on_ground = False
-
-            # Horizontal movement and resolve
-            ent.x += int(kin.vx * dt)
-            for t in self.tiles:
-                if ent.colliderect(t):
-                    if kin.vx > 0:
-                        ent.right = t.left
-                    elif kin.vx < 0:
-                        ent.left = t.right
-                    kin.vx = 0.0
-                    break
-
-            tr.x, tr.y = ent.x, ent.y
+        world = self.world
+        last, current = self._last, {}
+        # Controller, Params and JumpState are optional: bodies moved by
+        # physics.MovementSystem sleep too, with the default Params
+        controllers = world.components.get(Controller, {})
+        params = world.components.get(Params, {})
+        jumps = world.components.get(JumpState, {})
+        for e, tr, kin in world.query(Transform, Kinematics, exclude=(Sleeping,)):
+            pos = (tr.x, tr.y)
+            current[e] = pos
+            prm = params.get(e, _DEFAULT_PARAMS)
+            ctrl = controllers.get(e)
+            js = jumps.get(e)
+            resting = (last.get(e) == pos and abs(kin.vx) < prm.sleep_speed
+                       and (js is None or js.buffer <= 0.0)
+                       and (ctrl is None or not (ctrl.left or ctrl.right or ctrl.jump_pressed)))
+            if not resting:
+                kin.rest_time = 0.0
+                continue
+            kin.rest_time += dt
+            if kin.rest_time >= prm.sleep_delay:
+                kin.vx = kin.vy = 0.0
+                world.commands.add(e, Sleeping())
+        self._last = current
 
+        if self.broadphase is not None:
+            for a, b in self.broadphase.began:
+                wake(world, a)
+                wake(world, b)
 
+        if self._changed:
+            grid = self.grid
+            cs = grid.cell_size
+            cells = self._changed
+            self._changed = []
+            for e, tr, col, _ in world.query(Transform, Collider, Sleeping):
+                c0, r0 = grid.cell_at(tr.x - cs, tr.y - cs)
+                c1, r1 = grid.cell_at(tr.x + col.w + cs, tr.y + col.h + cs)
+                if any(c0 <= cx <= c1 and r0 <= cy <= r1 for cx, cy in cells):
+                    wake(world, e)
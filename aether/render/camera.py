@@ -1,3 +1,8 @@
+from math import floor
+
+import pygame
+
+
 class Camera:
     def __init__(self, width: int, height: int):
         self.x = 0.0
@@ -9,4 +14,20 @@ class Camera:
         self.x += (tx - self.width / 2 - self.x) * slowness
         self.y += (ty - self.height / 2 - self.y) * slowness
 
+    def view_rect(self, margin: int = 0) -> pygame.Rect:
+        """Visible world area (whole pixels), grown by `margin` on every side."""
+        return pygame.Rect(floor(self.x) - margin, floor(self.y) - margin,
+                           self.width + 2 * margin, self.height + 2 * margin)
+
+    def is_visible(self, x: float, y: float, w: float, h: float, margin: int = 0) -> bool:
+        vx, vy = floor(self.x) - margin, floor(self.y) - margin
+        return (x < vx + self.width + 2 * margin and vx < x + w
+                and y < vy + self.height + 2 * margin and vy < y + h)
+
+    def cull(self, index, margin: int = 0) -> set:
+        """Keys of a SpatialHash whose boxes are in view; costs the cells
+        under the view plus the results, not the size of the index."""
+        return index.query(*self.view_rect(margin))
 
+    def to_screen(self, x: float, y: float):
+        return x - floor(self.x), y - floor(self.y)
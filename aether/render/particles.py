@@ -0,0 +1,122 @@
+from itertools import repeat
+
+import numpy as np
+import pygame
+
+
+class ParticlePool:
+    """Fixed-capacity particle system stored in NumPy arrays.
+
+    Live particles are packed at the front of the arrays (`count` of them);
+    update() moves, ages and shrinks them all at once and compacts out the
+    dead ones. Each particle draws as a filled alpha circle whose alpha
+    fades from `alpha` to 0 over its last `fade` seconds of life. Circles are
+    pre-rendered once per (color, whole-pixel radius, alpha level) with
+    alpha quantized to `alpha_levels` steps, and render() draws every
+    particle in a single Surface.blits call. Emitting into a full pool drops
+    the extra particles.
+    """
+
+    def __init__(self, capacity: int = 4096, shrink: float = 1.0, alpha_levels: int = 32,
+                 blend: int = 0, max_cached: int = 4096):
+        self.capacity = int(capacity)
+        self.shrink = shrink  # radius factor per update()
+        self.alpha_levels = int(alpha_levels)
+        self.blend = blend    # special_flags for every blit
+        self.max_cached = max_cached
+        self.count = 0
+        n = self.capacity
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.radius = np.zeros(n)
+        self.life = np.zeros(n)
+        self.fade = np.ones(n)
+        self.alpha = np.zeros(n)
+        self.color = np.zeros(n, dtype=np.intp)  # index into palette
+        self.palette = []    # [(r, g, b)]
+        self._colors = {}    # {(r, g, b): palette index}
+        self.sprites = {}    # {(palette index, radius, alpha level): Surface or None}
+
+    def emit(self, x, y, radius, color, life: float = 1.0, alpha=255, fade=None, vx=0.0, vy=0.0) -> int:
+        """Add particles; array arguments emit one per element, scalars broadcast.
+
+        `color` is one (r, g, b) for the whole batch; `fade` defaults to `life`.
+        Returns the number of particles actually added.
+        """
+        x, y, radius, life, alpha, fade, vx, vy = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (x, y, radius, life, alpha, life if fade is None else fade, vx, vy)))
+        n = min(x.size, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        color = tuple(color)
+        index = self._colors.get(color)
+        if index is None:
+            index = self._colors[color] = len(self.palette)
+            self.palette.append(color)
+        s = slice(self.count, self.count + n)
+        for dst, src in ((self.x, x), (self.y, y), (self.radius, radius), (self.life, life),
+                         (self.alpha, alpha), (self.fade, fade), (self.vx, vx), (self.vy, vy)):
+            dst[s] = src.ravel()[:n]
+        self.color[s] = index
+        self.count += n
+        return n
+
+    def update(self, dt: float):
+        n = self.count
+        if not n:
+            return
+        self.life[:n] -= dt
+        self.radius[:n] *= self.shrink
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        alive = self.life[:n] > 0.0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for a in (self.x, self.y, self.vx, self.vy, self.radius, self.life, self.fade, self.alpha, self.color):
+                a[:live] = a[:n][alive]
+            self.count = live
+
+    def clear(self):
+        self.count = 0
+
+    def render(self, surface, offset=(0, 0), app=None) -> int:
+        """Blit every live particle, shifted by -offset; returns the blit count.
+        Reports the blitted regions to a dirty-rect App through app.mark_drawn."""
+        n = self.count
+        if not n:
+            return 0
+        steps = self.alpha_levels - 1
+        r = self.radius[:n].astype(np.intp)
+        level = (self.alpha[:n] * np.clip(self.life[:n] / self.fade[:n], 0.0, 1.0) * (steps / 255.0)).astype(np.intp)
+        drawn = np.flatnonzero((r > 0) & (level > 0))  # the rest are empty sprites
+        if not drawn.size:
+            return 0
+        r, level, color = r[drawn], level[drawn], self.color[drawn]
+        left = np.trunc(self.x[drawn] - self.radius[drawn]).astype(np.intp) - int(offset[0])
+        top = np.trunc(self.y[drawn] - self.radius[drawn]).astype(np.intp) - int(offset[1])
+        # One cache lookup per distinct sprite rather than per particle
+        keys = (color * (int(r.max()) + 1) + r) * self.alpha_levels + level
+        unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        if len(self.sprites) + unique.size > self.max_cached:
+            self.sprites.clear()
+        sprites = [self._sprite(int(color[i]), int(r[i]), int(level[i])) for i in first]
+        track = app is not None and app.dirty_rects
+        rects = surface.blits(zip(map(sprites.__getitem__, inverse.ravel().tolist()), zip(left.tolist(), top.tolist()),
+                                  repeat(None), repeat(self.blend)), doreturn=track)
+        if track:
+            app.mark_drawn(rects)
+        return int(drawn.size)
+
+    def _sprite(self, color, r, level):
+        key = (color, r, level)
+        if key in self.sprites:
+            return self.sprites[key]
+        alpha = level * 255 // (self.alpha_levels - 1)
+        sprite = None
+        if r > 0 and alpha > 0:
+            sprite = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, self.palette[color] + (alpha,), (r, r), max(2, r))
+        self.sprites[key] = sprite
+        return sprite
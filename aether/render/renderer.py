@@ -1,21 +1,97 @@
-import pygame
+from bisect import insort
+
+from ..ecs.component import Component, component
 from ..ecs.system import System
+from ..physics.physics import Transform
+
+
+class Screen:
+    """Marker for System.writes: the system draws to the shared display surface.
+
+    Declaring it keeps drawing systems in priority order under the Scheduler.
+    """
+
+
+@component
+class Sprite(Component):
+    """Image drawn at the entity's Transform; `image` is an AssetManager key.
+
+    Lower `z` layers are drawn first; within a layer sprites keep a stable
+    order (the world's query order).
+    """
+    image: str
+    z: int = 0
+    offset_x: float = 0.0
+    offset_y: float = 0.0
+    visible: bool = True
 
 
 class RenderSystem(System):
+    """Draws every visible Sprite, culled to the camera view, one Surface.blits per z-layer.
+
+    Sprites are bucketed by layer each frame, so ordering costs no sort;
+    the list of layers is kept sorted incrementally as new z values appear.
+    After an update `drawn` and `culled` hold the frame's sprite counts.
+    Given a dirty-rect App, the blitted regions are reported through
+    app.mark_drawn.
+    """
     priority = 100
+    reads = (Transform, Sprite)
+    writes = (Screen,)
 
-    def __init__(self, world, assets=None, surface=None, camera=None):
+    def __init__(self, world, assets=None, surface=None, camera=None, app=None):
         super().__init__(world)
         self.assets = assets
         self.surface = surface
         self.camera = camera
+        self.app = app
+        self.layers = []  # sorted z values seen so far
+        self.drawn = 0
+        self.culled = 0
 
     def update(self, dt: float):
         if not self.surface:
             return
-        # Placeholder: systems that draw should do so here.
-        # Actual sprite drawing will be added when we wire components.
-        pass
-
+        view = self.camera.view_rect() if self.camera is not None else self.surface.get_rect()
+        vx, vy, vr, vb = view.x, view.y, view.right, view.bottom
+        images = self.assets.images if self.assets is not None else {}
+        sizes = {}     # {image key: (surface, w, h)} for this frame
+        buckets = {}   # {z: [(surface, (x, y)), ...]}
+        culled = 0
+        for e, tr, spr in self.world.query(Transform, Sprite):
+            if not spr.visible:
+                continue
+            info = sizes.get(spr.image)
+            if info is None:
+                img = images.get(spr.image)
+                info = sizes[spr.image] = (img, *img.get_size()) if img is not None else (None, 0, 0)
+            img, w, h = info
+            if img is None:
+                continue
+            x = tr.x + spr.offset_x
+            y = tr.y + spr.offset_y
+            if x >= vr or y >= vb or x + w <= vx or y + h <= vy:
+                culled += 1
+                continue
+            bucket = buckets.get(spr.z)
+            if bucket is None:
+                bucket = buckets[spr.z] = []
+                if spr.z not in self.layers:
+                    insort(self.layers, spr.z)
+            bucket.append((img, (x - vx, y - vy)))
 
+        drawn = 0
+        blits = self.surface.blits
+        track = self.app is not None and self.app.dirty_rects
+        for z in self.layers:
+            bucket = buckets.get(z)
+            if bucket:
+                rects = blits(bucket, doreturn=track)
+                if track:
+                    self.app.mark_drawn(rects)
+                drawn += len(bucket)
+        self.drawn, self.culled = drawn, culled
+        profiler = self.world.profiler
+        if profiler is not None:
+            profiler.count('RenderSystem.sprites', drawn)
+            profiler.count('RenderSystem.culled', culled)
@@ -0,0 +1,148 @@
+from itertools import islice
+
+import pygame
+
+
+CHUNK_PIXELS = 512
+
+
+class ChunkedTileRenderer:
+    """Draws a static tile layer from pre-rendered chunks.
+
+    Tiles are baked `chunk_size` x `chunk_size` at a time into transparent
+    surfaces the first time a chunk is visible; each frame only the chunks
+    overlapping the view are blitted, in one Surface.blits call. Change
+    tiles through set_tile() (or call invalidate()) so the affected chunk is
+    re-baked on its next draw.
+
+    `chunk_size` defaults to about CHUNK_PIXELS per side whatever the tile
+    size, and at most `max_chunks` baked chunks are kept (plus any more the
+    view needs); the least recently drawn are dropped and re-baked if they
+    come back into view.
+
+    `tile_surface(tile_id)` returns the Surface for a tile id, or None for
+    tiles that draw nothing.
+    """
+
+    def __init__(self, tilemap, tile_size: int, tile_surface, chunk_size: int | None = None, origin=(0, 0),
+                 max_chunks: int = 64):
+        self.tilemap = tilemap  # rows of tile ids
+        self.tile_size = int(tile_size)
+        self.tile_surface = tile_surface
+        self.chunk_size = int(chunk_size) if chunk_size else max(1, CHUNK_PIXELS // self.tile_size)
+        self.origin_x, self.origin_y = origin
+        self.max_chunks = max_chunks
+        self.chunks = {}    # {(kx, ky): Surface, or None for an empty chunk}, least recently drawn first
+        self.fills = None   # (color, {(kx, ky): [chunk-local Rect]}) to bake by filling rects instead
+        self._dirty = set()
+
+    @classmethod
+    def from_grid(cls, grid, color, chunk_size: int | None = None) -> 'ChunkedTileRenderer':
+        """Solid cells of a TileGrid drawn as filled squares; follows TileGrid.set_solid."""
+        cs = grid.cell_size
+        square = pygame.Surface((cs, cs))
+        square.fill(color)
+        cols = grid.cols
+        tilemap = [list(grid.solid[r * cols:(r + 1) * cols]) for r in range(grid.rows)]
+        renderer = cls(tilemap, cs, lambda tile_id: square if tile_id else None, chunk_size,
+                       (grid.origin_x, grid.origin_y))
+        grid.listeners.append(lambda cx, cy: renderer.set_tile(cx, cy, grid.solid[cy * cols + cx]))
+        return renderer
+
+    @classmethod
+    def from_level(cls, level, color, chunk_size: int | None = None) -> 'ChunkedTileRenderer':
+        """from_grid for a CompiledLevel, baking each chunk by filling the
+        level's merged rects that cross it rather than blitting every cell."""
+        renderer = cls.from_grid(level.grid, color, chunk_size)
+        span = renderer.tile_size * renderer.chunk_size
+        ox, oy = renderer.origin_x, renderer.origin_y
+        bounds = pygame.Rect(0, 0, span, span)
+        index = {}
+        for rect in level.rects:
+            x0, y0 = rect.x - ox, rect.y - oy
+            for ky in range(y0 // span, (y0 + rect.h - 1) // span + 1):
+                for kx in range(x0 // span, (x0 + rect.w - 1) // span + 1):
+                    # Clipped here: Surface.fill shifts rather than clips negative offsets
+                    local = rect.move(-ox - kx * span, -oy - ky * span).clip(bounds)
+                    index.setdefault((kx, ky), []).append(local)
+        renderer.fills = (color, index)
+        return renderer
+
+    def set_tile(self, cx: int, cy: int, tile_id):
+        self.tilemap[cy][cx] = tile_id
+        self.fills = None  # the merged rects no longer match; bake from tiles from now on
+        self.invalidate(cx, cy)
+
+    def invalidate(self, cx: int | None = None, cy: int | None = None):
+        """Re-bake the chunk holding tile (cx, cy) on its next draw; every chunk without arguments."""
+        if cx is None:
+            self.chunks.clear()
+        else:
+            self._dirty.add((cx // self.chunk_size, cy // self.chunk_size))
+
+    def render(self, surface, camera=None, app=None) -> int:
+        """Blit the chunks inside camera.view_rect() (the surface's own rect
+        without a camera); returns the blit count. Reports the blitted
+        regions to a dirty-rect App through app.mark_drawn."""
+        view = camera.view_rect() if camera is not None else surface.get_rect()
+        span = self.tile_size * self.chunk_size
+        left, top = view.x - self.origin_x, view.y - self.origin_y
+        last_ky = (len(self.tilemap) - 1) // self.chunk_size
+        last_kx = (max((len(row) for row in self.tilemap), default=0) - 1) // self.chunk_size
+        blits = []
+        visible = 0
+        for ky in range(max(0, top // span), min(last_ky, (top + view.h) // span) + 1):
+            for kx in range(max(0, left // span), min(last_kx, (left + view.w) // span) + 1):
+                visible += 1
+                chunk = self._chunk(kx, ky)
+                if chunk is not None:
+                    blits.append((chunk, (self.origin_x + kx * span - view.x, self.origin_y + ky * span - view.y)))
+        # Drop the least recently drawn chunks; the visible ones are the newest
+        excess = len(self.chunks) - max(self.max_chunks, visible)
+        for key in list(islice(self.chunks, excess)) if excess > 0 else ():
+            del self.chunks[key]
+        if blits:
+            if app is not None and app.dirty_rects:
+                app.mark_drawn(surface.blits(blits))
+            else:
+                surface.blits(blits, doreturn=False)
+        return len(blits)
+
+    def _chunk(self, kx, ky):
+        key = (kx, ky)
+        if key in self._dirty:
+            self._dirty.discard(key)
+            self.chunks.pop(key, None)
+        elif key in self.chunks:
+            chunk = self.chunks[key] = self.chunks.pop(key)  # now most recently drawn
+            return chunk
+        chunk = self.chunks[key] = self._bake(kx, ky)
+        return chunk
+
+    def _bake(self, kx, ky):
+        n, ts = self.chunk_size, self.tile_size
+        if self.fills is not None:
+            color, index = self.fills
+            rects = index.get((kx, ky))
+            if not rects:
+                return None
+            chunk = pygame.Surface((n * ts, n * ts), pygame.SRCALPHA)
+            for rect in rects:
+                chunk.fill(color, rect)
+        else:
+            blits = []
+            for r, row in enumerate(self.tilemap[ky * n:(ky + 1) * n]):
+                for c, tile_id in enumerate(row[kx * n:(kx + 1) * n]):
+                    img = self.tile_surface(tile_id)
+                    if img is not None:
+                        blits.append((img, (c * ts, r * ts)))
+            if not blits:
+                return None
+            chunk = pygame.Surface((n * ts, n * ts), pygame.SRCALPHA)
+            chunk.blits(blits, doreturn=False)
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert_alpha()
+        # Chunks never change once baked; run-length encoding lets blits skip
+        # their transparent areas instead of blending every pixel
+        chunk.set_alpha(255, pygame.RLEACCEL)
+        return chunk
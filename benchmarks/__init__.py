@@ -0,0 +1 @@
+"""Performance benchmarks for aether; run with `python -m benchmarks`."""
@@ -0,0 +1,46 @@
+import argparse
+import json
+import os
+import sys
+
+from .harness import ROOT, Suite, compare
+
+MODULES = ('bench_ecs', 'bench_physics', 'bench_render')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run aether benchmarks.')
+    parser.add_argument('--out', default='bench_results.json', help='JSON results path')
+    parser.add_argument('--repeat', type=int, default=5, help='samples per benchmark')
+    parser.add_argument('--quick', action='store_true', help='smaller sizes for a fast smoke run')
+    parser.add_argument('--only', action='append', help='run benchmarks whose name starts with this prefix')
+    parser.add_argument('--baseline', help='earlier results JSON to compare against')
+    args = parser.parse_args(argv)
+
+    # Render benchmarks need a display surface but never a real window
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    out = os.path.abspath(args.out)
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+
+    import importlib
+    import pygame
+    pygame.init()
+
+    suite = Suite(repeat=args.repeat, quick=args.quick, only=args.only)
+    for name in MODULES:
+        importlib.import_module(f'.{name}', __package__).run(suite)
+    suite.write(out)
+    print(f'wrote {len(suite.results)} results to {out}')
+
+    if baseline:
+        with open(baseline) as f:
+            slower = compare(json.load(f), suite.to_json())
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
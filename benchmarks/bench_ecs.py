@@ -0,0 +1,113 @@
+import tracemalloc
+
+from aether.ecs.world import World
+from aether.physics.physics import Transform, Kinematics, Collider, use_columnar
+
+
+def populate(n: int) -> World:
+    world = World()
+    for i in range(n):
+        e = world.create()
+        world.add(e, Transform(i, 0))
+        world.add(e, Kinematics())
+        if i % 2:
+            world.add(e, Collider(16, 16))
+    return world
+
+
+def _create(n):
+    def fn(world):
+        for _ in range(n):
+            world.create()
+    return fn
+
+
+def _add(n):
+    def fn(state):
+        world, entities = state
+        for e in entities:
+            world.add(e, Transform())
+            world.add(e, Kinematics())
+    return fn
+
+
+def _fresh_entities(n):
+    def setup():
+        world = World()
+        return world, [world.create() for _ in range(n)]
+    return setup
+
+
+def _query(world):
+    for _ in world.query(Transform, Kinematics):
+        pass
+
+
+def _warm(n):
+    def setup():
+        world = populate(n)
+        _query(world)
+        return world
+    return setup
+
+
+def _churn(n, alive=500, live=None):
+    def fn(world):
+        # A fresh live list per run: each timed run gets a new World
+        entities = [] if live is None else live
+        for i in range(n):
+            e = world.create()
+            world.add(e, Transform(i, 0))
+            world.add(e, Kinematics())
+            entities.append(e)
+            if len(entities) > alive:
+                world.destroy(entities.pop(0))
+    return fn
+
+
+def _snapshotted(n, columnar=False):
+    def setup():
+        world = World()
+        if columnar:
+            use_columnar(world, capacity=n)
+        for i in range(n):
+            e = world.create()
+            world.add_many(e, (Transform(i, 0), Kinematics()))
+        return world, world.snapshot()
+    return setup
+
+
+def _snapshot(state):
+    state[0].snapshot()
+
+
+def _restore(state):
+    world, snap = state
+    world.restore(snap)
+
+
+def run(suite):
+    for n in suite.sizes((1_000, 10_000, 50_000), (1_000, 5_000)):
+        suite.time('ecs.create', _create(n), setup=World, n=n)
+        suite.time('ecs.add', _add(n), setup=_fresh_entities(n), n=n)
+        suite.time('ecs.query.cold', _query, setup=lambda: populate(n), n=n)
+        suite.time('ecs.query.warm', _query, setup=_warm(n), number=10, n=n)
+        suite.time('ecs.churn', _churn(n), setup=World, n=n)
+        for columnar in (False, True):
+            suite.time('ecs.snapshot', _snapshot, setup=_snapshotted(n, columnar), number=10, n=n, columnar=columnar)
+            suite.time('ecs.restore', _restore, setup=_snapshotted(n, columnar), number=10, n=n, columnar=columnar)
+
+    world = populate(suite.sizes(10_000, 1_000))
+    for name, info in world.memory_report().items():
+        suite.record('ecs.memory', info['bytes'], 'bytes', component=name, count=info['count'])
+
+    # Spawning and destroying should not grow memory once the live set is steady
+    n = suite.sizes(100_000, 20_000)
+    world, live = World(), []
+    tracemalloc.start()
+    _churn(n // 10, live=live)(world)
+    steady = tracemalloc.get_traced_memory()[0]
+    _churn(n, live=live)(world)
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    suite.record('ecs.churn.memory_growth', end - steady, 'bytes', n=n)
@@ -0,0 +1,136 @@
+import random
+
+import numpy as np
+
+from aether.ecs.world import World
+from aether.physics.physics import Collider, Kinematics, Substeps, Transform
+from aether.physics.raycast import line_of_sight_many
+from aether.physics.tilegrid import TileGrid
+from aether.platformer.character import Character
+from aether.platformer.components import JumpState, use_columnar
+from aether.platformer.systems import MovementSystem, SleepSystem, TileCollisionSystem
+
+from .levels import level_rects, tile_level, tutorial_levels
+
+TILE_SIZE = 64
+FRAMES = 10
+
+
+def _movement_world(n: int, columnar: bool):
+    def setup():
+        world = World()
+        if columnar:
+            use_columnar(world, capacity=n)
+        for i in range(n):
+            Character(world, (i % 200) * 40, (i // 200) * 60)
+        world.add_system(MovementSystem(world))
+        return world
+    return setup
+
+
+def _collision_world(layout, bodies: int, continuous: bool = False, columnar: bool = False):
+    def setup():
+        world = World()
+        if columnar:
+            use_columnar(world, capacity=bodies)
+        width = max(len(row) for row in layout) * TILE_SIZE
+        for i in range(bodies):
+            Character(world, (i * 97) % max(1, width - 64), 64)
+        world.add_system(MovementSystem(world))
+        world.add_system(TileCollisionSystem(world, level_rects(layout, TILE_SIZE), continuous=continuous))
+        return world
+    return setup
+
+
+def _settled_world(layout, bodies: int, sleep: bool):
+    def setup():
+        world = _collision_world(layout, bodies)()
+        if sleep:
+            world.add_system(SleepSystem(world))
+        for _ in range(120):  # land and, with SleepSystem, fall asleep
+            world.update(1.0 / 60.0)
+        return world
+    return setup
+
+
+def _sight_lines(layout, n: int):
+    def setup():
+        grid = TileGrid.from_ascii(layout, TILE_SIZE)
+        rnd = random.Random(n)
+        w, h = grid.cols * TILE_SIZE, grid.rows * TILE_SIZE
+        pts = np.array([(rnd.uniform(0, w), rnd.uniform(0, h), rnd.uniform(0, w), rnd.uniform(0, h)) for _ in range(n)])
+        return grid, pts
+    return setup
+
+
+def _los_scalar(state):
+    grid, pts = state
+    for ax, ay, bx, by in pts.tolist():
+        grid.line_of_sight(ax, ay, bx, by)
+
+
+def _los_batched(state):
+    grid, pts = state
+    line_of_sight_many(grid, *pts.T)
+
+
+def _substep_distance(count: int, frames: int = 60) -> float:
+    """Pixels a body at vx=100 px/s covers in open space with Substeps(count)."""
+    world = World()
+    world.add_system(TileCollisionSystem(world, TileGrid(200, 4, TILE_SIZE)))
+    e = world.create()
+    world.add_many(e, (Transform(0, 0), Kinematics(vx=100.0), Collider(16, 16), JumpState(), Substeps(count)))
+    for _ in range(frames):
+        world.update(1.0 / 60.0)
+    return world.get(e, Transform).x
+
+
+def _frames(world):
+    for _ in range(FRAMES):
+        world.update(1.0 / 60.0)
+
+
+def run(suite):
+    # Correctness check rather than a timing: sub-stepping must not change
+    # how far a body travels
+    distances = {count: _substep_distance(count) for count in (1, 2, 4, 8)}
+    for count, distance in distances.items():
+        suite.record('platformer.substeps.distance', round(distance, 3), 'px', count=count)
+    if max(distances.values()) - min(distances.values()) > 1e-6:
+        raise AssertionError(f'distance travelled depends on Substeps.count: {distances}')
+
+    for n in suite.sizes((100, 1_000, 10_000), (100, 1_000)):
+        suite.time('platformer.movement', _frames, setup=_movement_world(n, False), n=n, frames=FRAMES)
+        suite.time('platformer.movement.columnar', _frames, setup=_movement_world(n, True), n=n, frames=FRAMES)
+
+    for name, layout in tutorial_levels().items():
+        suite.time('platformer.collision.level', _frames, setup=_collision_world(layout, 20),
+                   level=name, bodies=20, frames=FRAMES)
+
+    base = tutorial_levels()['TUTORIAL_LEVEL']
+    # Up to ~1000x200 tiles (TUTORIAL_LEVEL is 65x15)
+    for nx, ny in suite.sizes(((1, 1), (4, 1), (16, 1), (16, 14)), ((1, 1), (4, 1))):
+        layout = tile_level(base, nx, ny)
+        for bodies in suite.sizes((10, 100), (10,)):
+            suite.time('platformer.collision.scale', _frames, setup=_collision_world(layout, bodies),
+                       cols=len(layout[0]), rows=len(layout), bodies=bodies, frames=FRAMES)
+
+    # Crowds through the batched NumPy path
+    crowd = tile_level(base, 16, 4)
+    for bodies in suite.sizes((100, 1_000, 5_000), (100, 1_000)):
+        for columnar in (False, True):
+            suite.time('platformer.collision.crowd', _frames, setup=_collision_world(crowd, bodies, columnar=columnar),
+                       bodies=bodies, columnar=columnar, frames=FRAMES)
+
+    for bodies in suite.sizes((100, 500), (100,)):
+        suite.time('platformer.collision.continuous', _frames, setup=_collision_world(base, bodies, True),
+                   bodies=bodies, frames=FRAMES)
+
+    for bodies in suite.sizes((100, 1_000), (100,)):
+        for sleep in (False, True):
+            suite.time('platformer.collision.settled', _frames, setup=_settled_world(base, bodies, sleep),
+                       bodies=bodies, sleep=sleep, frames=FRAMES)
+
+    for n in suite.sizes((100, 1_000), (100,)):
+        suite.time('physics.line_of_sight', _los_scalar, setup=_sight_lines(base, n), n=n)
+        suite.time('physics.line_of_sight.batched', _los_batched, setup=_sight_lines(base, n), n=n)
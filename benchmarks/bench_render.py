@@ -0,0 +1,95 @@
+import random
+
+import pygame
+
+from aether.assets.assets import AssetManager
+from aether.ecs.world import World
+from aether.physics.physics import Transform
+from aether.physics.level import compile_level
+from aether.render.camera import Camera
+from aether.render.particles import ParticlePool
+from aether.render.renderer import RenderSystem, Sprite
+from aether.render.tilecache import ChunkedTileRenderer
+
+from .levels import chunk_tilemap, level_rects, tile_level, tutorial_levels
+
+SCREEN = (1200, 800)
+TILE_SIZE = 64
+
+
+def _draw_rects(rects):
+    def fn(screen):
+        # Same per-platform loop appv2 uses, with a fixed camera
+        for tile in rects:
+            pygame.draw.rect(screen, (100, 100, 100), pygame.Rect(tile.x - 100, tile.y - 100, tile.w, tile.h))
+    return fn
+
+
+def _sprites(screen, count):
+    """RenderSystem over `count` sprites on three layers, scattered across 4x4 screens."""
+    assets = AssetManager()
+    for i, color in enumerate(((200, 60, 60), (60, 200, 60), (60, 60, 200))):
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        image.fill(color + (200,))
+        assets.images[f'sprite{i}'] = image
+    world = World()
+    rng = random.Random(0)
+    for i in range(count):
+        e = world.create()
+        world.add(e, Transform(rng.uniform(0, SCREEN[0] * 4), rng.uniform(0, SCREEN[1] * 4)))
+        world.add(e, Sprite(f'sprite{i % 3}', z=rng.randrange(3)))
+    camera = Camera(*SCREEN)
+    camera.x, camera.y = SCREEN[0] * 1.5, SCREEN[1] * 1.5
+    return RenderSystem(world, assets, screen, camera)
+
+
+def _particles(count):
+    """Pool of `count` glowing particles spread over the screen, mid-fade.
+
+    shrink=1.0 so update(0.0) leaves the pool as it was and every call draws
+    the same particles.
+    """
+    rng = random.Random(0)
+    pool = ParticlePool(count, shrink=1.0, blend=pygame.BLEND_PREMULTIPLIED)
+    pool.emit([rng.uniform(0, SCREEN[0]) for _ in range(count)], [rng.uniform(0, SCREEN[1]) for _ in range(count)],
+              [rng.randint(4, 16) for _ in range(count)], (240, 230, 70),
+              life=[rng.uniform(0.7, 1.0) for _ in range(count)], alpha=200, fade=1.0)
+    return pool
+
+
+def run(suite):
+    import layered_world_demo
+
+    screen = pygame.display.set_mode(SCREEN)
+    base = tutorial_levels()['TUTORIAL_LEVEL']
+    for nx in suite.sizes((1, 4, 16), (1, 4)):
+        layout = tile_level(base, nx)
+        rects = level_rects(layout, TILE_SIZE)
+        suite.time('render.level_rects', _draw_rects(rects), setup=lambda: screen, number=10,
+                   cols=len(layout[0]), rows=len(layout), tiles=len(rects))
+        merged = compile_level(layout, TILE_SIZE).rects
+        suite.time('render.level_rects.merged', _draw_rects(merged), setup=lambda: screen, number=10,
+                   cols=len(layout[0]), rows=len(layout), tiles=len(merged))
+        chunked = ChunkedTileRenderer.from_grid(compile_level(layout, TILE_SIZE).grid, (100, 100, 100))
+        camera = Camera(*SCREEN)
+        camera.x = camera.y = 100
+        chunked.render(screen, camera)  # bake the visible chunks outside the timing
+        suite.time('render.level_chunks', lambda s: chunked.render(s, camera), setup=lambda: screen, number=10,
+                   cols=len(layout[0]), rows=len(layout))
+
+    for count in suite.sizes((1000, 10000), (1000,)):
+        system = _sprites(screen, count)
+        suite.time('render.sprites', lambda s: system.update(0.0), setup=lambda: screen, number=10, sprites=count)
+
+    for count in suite.sizes((1000, 10000), (1000,)):
+        pool = _particles(count)
+        suite.time('render.particles', lambda s: (pool.update(0.0), pool.render(s)), setup=lambda: screen, number=10,
+                   particles=count)
+
+    layered_world_demo.generate_demo_tiles()
+    layer = layered_world_demo.ActualLayer(chunk_tilemap('actual_layer.bin'))
+    suite.time('render.chunk_tiles', lambda s: layer.render(s), setup=lambda: screen, number=10,
+               layer='actual_layer.bin')
+    collision = layered_world_demo.CollisionLayer(chunk_tilemap('collision_layer.bin'))
+    suite.time('render.collision_overlay', lambda s: collision.render(s), setup=lambda: screen, number=10,
+               layer='collision_layer.bin')
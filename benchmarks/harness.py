@@ -0,0 +1,104 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Suite:
+    """Collects timings as machine-readable records.
+
+    Each record is one benchmark at one parameter point (entity count, level
+    size, ...) with per-call seconds over `repeat` samples.
+    """
+
+    def __init__(self, repeat: int = 5, quick: bool = False, only=None):
+        self.repeat = repeat
+        self.quick = quick
+        self.only = only
+        self.results = []
+
+    def sizes(self, full, quick):
+        return quick if self.quick else full
+
+    def time(self, name: str, fn, setup=None, number: int = 1, **params):
+        """Time fn(state) where state = setup() is rebuilt (untimed) before every sample."""
+        if self.only and not any(name.startswith(prefix) for prefix in self.only):
+            return None
+        samples = []
+        for _ in range(self.repeat):
+            state = setup() if setup is not None else None
+            start = time.perf_counter()
+            for _ in range(number):
+                fn(state)
+            samples.append((time.perf_counter() - start) / number)
+        record = {
+            'name': name,
+            'params': params,
+            'repeat': self.repeat,
+            'number': number,
+            'min_s': min(samples),
+            'median_s': statistics.median(samples),
+            'mean_s': statistics.fmean(samples),
+        }
+        self.results.append(record)
+        shown = ' '.join(f'{k}={v}' for k, v in params.items())
+        print(f'{name:<32} {shown:<28} {record["median_s"] * 1e3:10.3f} ms')
+        return record
+
+    def record(self, name: str, value, unit: str, **params):
+        """Store a non-timing measurement (bytes, counts)."""
+        if self.only and not any(name.startswith(prefix) for prefix in self.only):
+            return None
+        record = {'name': name, 'params': params, 'value': value, 'unit': unit}
+        self.results.append(record)
+        shown = ' '.join(f'{k}={v}' for k, v in params.items())
+        print(f'{name:<32} {shown:<28} {value:>10} {unit}')
+        return record
+
+    def to_json(self) -> dict:
+        return {'meta': metadata(), 'results': self.results}
+
+    def write(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+def key(record) -> tuple:
+    return record['name'], tuple(sorted(record['params'].items()))
+
+
+def compare(baseline: dict, current: dict, threshold: float = 1.10):
+    """Print current/baseline median ratios; returns records slower than `threshold`."""
+    old = {key(r): r for r in baseline['results'] if 'median_s' in r}
+    slower = []
+    for r in current['results']:
+        base = old.get(key(r))
+        if base is None or 'median_s' not in r or not base['median_s']:
+            continue
+        ratio = r['median_s'] / base['median_s']
+        flag = '  REGRESSION' if ratio > threshold else ''
+        shown = ' '.join(f'{k}={v}' for k, v in r['params'].items())
+        print(f'{r["name"]:<32} {shown:<28} x{ratio:6.2f}{flag}')
+        if ratio > threshold:
+            slower.append(r)
+    return slower
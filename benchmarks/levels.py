@@ -0,0 +1,43 @@
+import os
+
+import pygame
+
+from .harness import ROOT
+
+LEVEL_NAMES = (
+    'TUTORIAL_LEVEL', 'TUTORIAL_LEVEL_IMPROVED', 'TUTORIAL_LEVEL_MOVEMENT_TEST',
+    'TUTORIAL_LEVEL_WALL_JUMP', 'TUTORIAL_LEVEL_SIMPLE_WALL_JUMP',
+    'TUTORIAL_LEVEL_WITH_ENERGY', 'TUTORIAL_LEVEL_EDGE_TEST',
+)
+
+
+def tutorial_levels() -> dict:
+    from levels import tutorial_level
+    return {name: getattr(tutorial_level, name) for name in LEVEL_NAMES}
+
+
+def tile_level(layout, nx: int, ny: int = 1):
+    """Repeat an ASCII layout nx times across and ny times down."""
+    width = max(len(row) for row in layout)
+    rows = [row.ljust(width) * nx for row in layout]
+    return rows * ny
+
+
+def level_rects(layout, tile_size: int):
+    rects = []
+    for row_idx, row in enumerate(layout):
+        for col_idx, cell in enumerate(row):
+            if cell == 'X':
+                rects.append(pygame.Rect(col_idx * tile_size, row_idx * tile_size, tile_size, tile_size))
+    return rects
+
+
+def chunk_tilemap(name: str = 'actual_layer.bin'):
+    """Tile ids from world_chunks/, as written by layered_world_demo."""
+    import layered_world_demo
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        return layered_world_demo.load_tile_layer(name)
+    finally:
+        os.chdir(cwd)
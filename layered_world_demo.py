@@ -3,6 +3,10 @@ import struct
 import os
 import random
 
+from aether.physics.masks import TileMaskCache
+from aether.render.particles import ParticlePool
+from aether.render.tilecache import ChunkedTileRenderer
+
 WIDTH, HEIGHT = 800, 600
 FPS = 60
 TILE_SIZE = 40
@@ -55,6 +59,14 @@ def load_tile_surface(tile_id):
 
 tile_surfaces = {}
 
+def get_tile_surface(tile_id):
+    if tile_id not in tile_surfaces:
+        tile_surfaces[tile_id] = load_tile_surface(tile_id)
+    return tile_surfaces[tile_id]
+
+# Collision masks/outlines per tile id, shared by CollisionLayer and entity tests
+tile_masks = TileMaskCache(get_tile_surface, lambda tile_id: tile_id in tile_assets and tile_assets[tile_id]['solid'])
+
 # --- BINARY LOADERS AND SAVERS ---
 def load_tile_layer(filename, width=ROOM_TILES_X, height=ROOM_TILES_Y):
     layer = []
@@ -152,112 +164,74 @@ class ParallaxLayer(Layer):
             if shp['rect'].right < 0: shp['rect'].left = WIDTH
             if shp['rect'].left > WIDTH: shp['rect'].right = 0
     def render(self, surf):
+        view = surf.get_rect()
         for shp in self.shapes:
-            pygame.draw.ellipse(surf, shp['color'], shp['rect'], 0)
+            if view.colliderect(shp['rect']):  # wrapped shapes can sit fully off screen
+                pygame.draw.ellipse(surf, shp['color'], shp['rect'], 0)
 
 # --- TILE RENDER ---
-def draw_tile(surf, tile_id, x, y):
+def tile_image(tile_id):
     if tile_id in tile_assets and tile_assets[tile_id]['filename']:
-        if tile_id not in tile_surfaces:
-            tile_surfaces[tile_id] = load_tile_surface(tile_id)
-        img = tile_surfaces[tile_id]
+        return get_tile_surface(tile_id)
+    return None
+
+def draw_tile(surf, tile_id, x, y):
+    img = tile_image(tile_id)
+    if img is not None:
         surf.blit(img, (x,y))
 
 # --- ACTUAL (TILES) ---
 class ActualLayer(Layer):
-    def __init__(self, tilemap): self.tilemap = tilemap
+    def __init__(self, tilemap):
+        self.tilemap = tilemap
+        # Tiles baked into ~512px chunks (12x12 at 40px) once; use self.tiles.set_tile to edit
+        self.tiles = ChunkedTileRenderer(tilemap, TILE_SIZE, tile_image)
     def render(self, surf):
-        for y, row in enumerate(self.tilemap):
-            for x, tile_id in enumerate(row):
-                draw_tile(surf, tile_id, x*TILE_SIZE, y*TILE_SIZE)
+        self.tiles.render(surf)
 
 # --- COLLISION (TILES) ---
 class CollisionLayer(Layer):
-    def __init__(self, tilemap):
+    def __init__(self, tilemap, masks=tile_masks):
         self.tilemap = tilemap
-        self.masks = {} # tile_id → Mask
+        self.masks = masks # shared TileMaskCache
+    def collides(self, mask, x, y):
+        """Pixel-perfect test of an entity mask at (x, y) against the solid tiles."""
+        return self.masks.collides(self.tilemap, TILE_SIZE, mask, x, y)
     def render(self, surf):
+        # Red outline of each solid tile's mask, pre-drawn once per tile id
         for y,row in enumerate(self.tilemap):
             for x,tile_id in enumerate(row):
-                if tile_id in tile_assets and tile_assets[tile_id]['solid']:
-                    # Draw red outline using mask (for prototype: just outline the nontransparent area)
-                    if tile_id not in tile_surfaces:
-                        tile_surfaces[tile_id] = load_tile_surface(tile_id)
-                    surf_img = tile_surfaces[tile_id]
-                    if tile_id not in self.masks:
-                        self.masks[tile_id] = pygame.mask.from_surface(surf_img)
-                    mask = self.masks[tile_id]
-                    offset = (x*TILE_SIZE, y*TILE_SIZE)
-                    # Draw red mask pixels
-                    outline_color = (220,40,50)
-                    points = mask.outline()
-                    if points:
-                        shifted_pts = [(px+offset[0], py+offset[1]) for (px,py) in points]
-                        if len(shifted_pts) > 1:
-                            pygame.draw.lines(surf, outline_color, True, shifted_pts, 2)
+                overlay, pad = self.masks.overlay(tile_id)
+                if overlay is not None:
+                    surf.blit(overlay, (x*TILE_SIZE - pad, y*TILE_SIZE - pad))
 
 # --- DATA-DRIVEN PARTICLE LAYER ---
-class TimedParticle:
-    def __init__(self, t, x, y, radius, color):
-        self.spawn_time = t
-        self.init_x, self.init_y = x, y
-        self.radius = radius
-        self.color = color
-        self.life = 0.8
-        self.spawned = False
-    def update(self, dt):
-        self.life -= dt
-        self.radius *= 0.98
-    def draw(self, surf):
-        if self.life>0:
-            alpha = int(155 * max(0, self.life/0.8))
-            surf_ = pygame.Surface((int(self.radius)*2, int(self.radius)*2), pygame.SRCALPHA)
-            pygame.draw.circle(surf_, self.color+(alpha,), (int(self.radius),int(self.radius)), max(2,int(self.radius)))
-            surf.blit(surf_, (int(self.init_x-self.radius),int(self.init_y-self.radius)), special_flags=pygame.BLEND_PREMULTIPLIED)
-
-class Particle:
-    def __init__(self, x, y, color=None, r=None):
-        self.x = x + random.randint(-6, 6)
-        self.y = y + random.randint(-6, 6)
-        self.radius = r if r else random.randint(10, 16)
-        self.color = color if color is not None else (240,230,70)
-        self.life = 0.7 + random.random()*0.3
-    def update(self, dt):
-        self.life -= dt
-        self.radius *= 0.98
-    def draw(self, surf):
-        if self.life > 0:
-            alpha = int(200 * max(0, self.life/1.0))
-            surf_ = pygame.Surface((int(self.radius)*2, int(self.radius)*2), pygame.SRCALPHA)
-            pygame.draw.circle(surf_, self.color+(alpha,), (int(self.radius),int(self.radius)), max(2,int(self.radius)))
-            surf.blit(surf_, (int(self.x-self.radius), int(self.y-self.radius)), special_flags=pygame.BLEND_PREMULTIPLIED)
-
 class ParticleLayer(Layer):
     def __init__(self, event_list):
-        self.timed_events = sorted([TimedParticle(e['time'],e['x'],e['y'],e['radius'],e['color']) for e in event_list], key=lambda e: e.spawn_time)
+        self.timed_events = sorted(event_list, key=lambda e: e['time'])
+        self.next_event = 0
         self.time = 0
-        self.spawned_particles = []
-        self.mouse_particles = []
+        # Additive-looking glow: circle colors are blitted as if premultiplied
+        self.particles = ParticlePool(capacity=8192, shrink=0.98, blend=pygame.BLEND_PREMULTIPLIED)
     def update(self, dt, events):
         self.time += dt
         # Trigger file-based events
-        for tpe in self.timed_events:
-            if not tpe.spawned and self.time >= tpe.spawn_time:
-                self.spawned_particles.append(tpe)
-                tpe.spawned = True
-        self.spawned_particles = [p for p in self.spawned_particles if p.life>0.0]
-        for p in self.spawned_particles: p.update(dt)
+        while self.next_event < len(self.timed_events) and self.time >= self.timed_events[self.next_event]['time']:
+            e = self.timed_events[self.next_event]
+            self.particles.emit(e['x'], e['y'], e['radius'], e['color'], life=0.8, alpha=155)
+            self.next_event += 1
         # Mouse click particles
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mx, my = pygame.mouse.get_pos()
-                for _ in range(random.randint(3,6)):
-                    self.mouse_particles.append(Particle(mx,my))
-        self.mouse_particles = [p for p in self.mouse_particles if p.life > 0.0]
-        for p in self.mouse_particles: p.update(dt)
+                n = random.randint(3,6)
+                self.particles.emit([mx + random.randint(-6, 6) for _ in range(n)],
+                                    [my + random.randint(-6, 6) for _ in range(n)],
+                                    [random.randint(10, 16) for _ in range(n)], (240,230,70),
+                                    life=[0.7 + random.random()*0.3 for _ in range(n)], alpha=200, fade=1.0)
+        self.particles.update(dt)
     def render(self, surf):
-        for p in self.spawned_particles: p.draw(surf)
-        for mp in self.mouse_particles: mp.draw(surf)
+        self.particles.render(surf)
 
 # --- FOREGROUND ---
 class ForegroundLayer(Layer):